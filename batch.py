@@ -0,0 +1,93 @@
+"""Whole-lexicon paradigm generation on a process pool.
+
+Work is split into chunks of lemmas in sorted order; each worker loads its own
+LatinDB once, assembles and serialises its chunk, and the parent writes the
+chunks back in submission order, so the output is byte-identical whatever the
+worker count.
+"""
+import contextlib
+import csv
+import io
+import json
+import os
+import time
+from multiprocessing import Pool
+
+from latin_engine import load_lexicon
+from paradigm_store import flatten_paradigm, CELL_SEP, EMPTY_LIST, EMPTY_DICT
+
+FORMATS = ('ndjson', 'csv')
+CSV_HEADER = ('lemma', 'cell', 'forms')
+
+_worker_db = None
+
+
+def count_forms(paradigm):
+    """Number of individual forms in an assembled paradigm (alternatives counted separately)."""
+    return sum(1 for _, text in flatten_paradigm(paradigm)
+               for form in text.split(' / ') if form and form != 'Ø')
+
+
+def format_paradigm(lemma, paradigm, fmt):
+    if fmt == 'ndjson':
+        return json.dumps({'lemma': lemma, 'paradigm': paradigm}, ensure_ascii=False) + '\n'
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    for path, text in flatten_paradigm(paradigm):
+        if text and text != 'Ø' and path[-1] not in (EMPTY_LIST, EMPTY_DICT):
+            writer.writerow((lemma, CELL_SEP.join(path), text))
+    return out.getvalue()
+
+
+def _init_worker(verbs_path, irregular_path, snapshot_path):
+    global _worker_db
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        # Paradigms are generated once each, so an LRU would only cost memory here.
+        _worker_db = load_lexicon(verbs_path, irregular_path, snapshot_path=snapshot_path, paradigm_cache_size=0)
+
+
+def _generate_chunk(args):
+    lemmas, fmt = args
+    parts = []
+    n_forms = 0
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for lemma in lemmas:
+            paradigm = _worker_db.get_paradigm(lemma)
+            n_forms += count_forms(paradigm)
+            parts.append(format_paradigm(lemma, paradigm, fmt))
+    return ''.join(parts), len(lemmas), n_forms
+
+
+def generate_batch(lemmas, out, verbs_path, irregular_path, snapshot_path=None, fmt='ndjson', workers=None,
+                   chunk_size=32):
+    """
+    Writes the assembled paradigm of every lemma to the text stream `out` and returns
+    (verbs, forms, seconds). `lemmas` should already be in the desired (e.g. sorted) order.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {FORMATS}")
+    workers = workers or os.cpu_count() or 1
+    chunks = [(lemmas[i:i + chunk_size], fmt) for i in range(0, len(lemmas), chunk_size)]
+    init_args = (verbs_path, irregular_path, snapshot_path)
+
+    started = time.perf_counter()
+    n_verbs = n_forms = 0
+    if fmt == 'csv':
+        csv.writer(out, lineterminator='\n').writerow(CSV_HEADER)
+    if workers == 1:
+        _init_worker(*init_args)
+        results = map(_generate_chunk, chunks)
+        pool = None
+    else:
+        pool = Pool(workers, initializer=_init_worker, initargs=init_args)
+        results = pool.imap(_generate_chunk, chunks)
+    try:
+        for text, chunk_verbs, chunk_forms in results:
+            out.write(text)
+            n_verbs += chunk_verbs
+            n_forms += chunk_forms
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return n_verbs, n_forms, time.perf_counter() - started
@@ -0,0 +1,76 @@
+"""Build time, memory and lookup latency of the full-form analyzer indexes.
+
+    python benchmarks/bench_form_index.py [--lookups N]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import latin_engine  # noqa: E402
+from form_analyzer import FormIndex, DemacronizedFormIndex  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        db = latin_engine.load_lexicon(os.path.join(REPO_DIR, 'verbs_Cicero.json'),
+                                       os.path.join(REPO_DIR, 'irregular_paradigms.json'))
+        # Build once untraced for the timing, once traced for the memory figure.
+        started = time.perf_counter()
+        index = FormIndex.build(db)
+        build_seconds = time.perf_counter() - started
+        del index
+        tracemalloc.start()
+        index = FormIndex.build(db)
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    forms = list(index.forms())
+    queries = random.Random(0).choices(forms, k=args.lookups)
+    started = time.perf_counter()
+    for form in queries:
+        index.analyze(form)
+    lookup_seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    plain_index = DemacronizedFormIndex(index)
+    plain_build_seconds = time.perf_counter() - started
+    plain_retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    worst = plain_index.largest_collisions(1)[0]
+    plain_queries = [form.translate(latin_engine.DEMACRON_MAP) for form in queries]
+    started = time.perf_counter()
+    for form in plain_queries:
+        plain_index.candidates(form)
+    plain_lookup_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    for _ in range(args.lookups):
+        plain_index.candidates(worst[0])
+    worst_lookup_seconds = time.perf_counter() - started
+
+    print(f"FormIndex over {len(index.lemmas)} verbs: {len(index):,} distinct forms")
+    print(f"  build   {build_seconds:8.2f} s")
+    print(f"  memory  {retained / 2**20:8.1f} MiB retained by the index")
+    print(f"  lookup  {lookup_seconds / args.lookups * 1e6:8.2f} µs per analyze() ({args.lookups:,} random hits)")
+    print(f"DemacronizedFormIndex: {len(plain_index):,} macron-less keys")
+    print(f"  build   {plain_build_seconds:8.2f} s (traced)")
+    print(f"  memory  {plain_retained / 2**20:8.1f} MiB retained on top of the FormIndex")
+    print(f"  lookup  {plain_lookup_seconds / args.lookups * 1e6:8.2f} µs per candidates() (random hits)")
+    print(f"  lookup  {worst_lookup_seconds / args.lookups * 1e6:8.2f} µs for the largest collision group "
+          f"({len(worst)} forms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Per-verb paradigm generation time over the whole Cicero lexicon.
+
+Times Verb.generate_paradigm (the engine's own forms) and LatinDB.build_paradigm
+(the full GUI assembly: irregular merge, master layout, archaic tenses, derived
+verbs), taking the best of several rounds. Nothing is cached between calls.
+It also reports, per verb, the memory blocks a finished paradigm holds and the
+peak traced memory while generating it (tracemalloc).
+
+Finally it checks that the derived artefacts go stale when the paradigm code
+changes: a lexicon snapshot and a disk paradigm cache written by this tree are
+reopened from a copy of it whose paradigm.py differs by one comment line. The
+copy must report a different engine fingerprint, rebuild the snapshot and miss
+every cached paradigm. Exits with status 1 if it does not.
+
+    python benchmarks/bench_generation.py [--rounds N]
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import latin_engine  # noqa: E402
+
+# Run in a fresh interpreter inside a source tree: loads the lexicon through the snapshot and the
+# disk cache, asks for some paradigms and reports what the caches did.
+CACHE_PROBE = """
+import contextlib, io, json, sys
+import latin_engine
+verbs_path, irregular_path, snapshot_path, disk_cache_path, lemmas = sys.argv[1:]
+log = io.StringIO()
+with contextlib.redirect_stdout(log):
+    db = latin_engine.load_lexicon(verbs_path, irregular_path, snapshot_path=snapshot_path,
+                                   disk_cache_path=disk_cache_path)
+    for lemma in json.loads(lemmas):
+        db.get_paradigm(lemma)
+print(json.dumps({'fingerprint': latin_engine.engine_fingerprint(), 'snapshot_stale': 'is stale' in log.getvalue(),
+                  'disk_hits': db.disk_cache.hits}))
+"""
+
+
+def best_of(rounds, run):
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def allocations(verbs, run):
+    """(live blocks, peak bytes) per verb for a paradigm built by run(verb) and kept alive."""
+    kept = []
+    blocks = sys.getallocatedblocks()
+    for verb in verbs:
+        kept.append(run(verb))
+    blocks = sys.getallocatedblocks() - blocks
+    kept.clear()
+    peak = 0
+    tracemalloc.start()
+    for verb in verbs:
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        run(verb)
+        peak += tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+    return blocks / len(verbs), peak / len(verbs)
+
+
+def paradigm_edit_invalidates(lemmas):
+    """
+    (ok, report lines): whether a one-line edit to paradigm.py makes the snapshot and the disk
+    cache written by this tree stale. The edit is made in a temporary copy of the sources.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        edited_dir = os.path.join(tmp, 'edited')
+        os.mkdir(edited_dir)
+        for path in glob.glob(os.path.join(REPO_DIR, '*.py')):
+            shutil.copy(path, edited_dir)
+        with open(os.path.join(edited_dir, 'paradigm.py'), 'a', encoding='utf-8') as f:
+            f.write('\n# edited\n')
+
+        def probe(source_dir):
+            args = [os.path.join(REPO_DIR, 'verbs_Cicero.json'), os.path.join(REPO_DIR, 'irregular_paradigms.json'),
+                    os.path.join(tmp, 'verbs.snapshot'), os.path.join(tmp, 'paradigms.sqlite3'), json.dumps(lemmas)]
+            result = subprocess.run([sys.executable, '-c', CACHE_PROBE, *args], cwd=source_dir,
+                                    capture_output=True, text=True, check=True)
+            return json.loads(result.stdout)
+
+        probe(REPO_DIR)  # writes the snapshot and fills the disk cache
+        warm = probe(REPO_DIR)
+        edited = probe(edited_dir)
+
+    ok = (not warm['snapshot_stale'] and warm['disk_hits'] == len(lemmas)
+          and edited['fingerprint'] != warm['fingerprint'] and edited['snapshot_stale'] and edited['disk_hits'] == 0)
+    return ok, [f"  this tree        fingerprint {warm['fingerprint']}  snapshot stale: {warm['snapshot_stale']!s:5}"
+                f"  disk cache hits {warm['disk_hits']}/{len(lemmas)}",
+                f"  paradigm.py +1   fingerprint {edited['fingerprint']}  snapshot stale: {edited['snapshot_stale']!s:5}"
+                f"  disk cache hits {edited['disk_hits']}/{len(lemmas)}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        db = latin_engine.load_lexicon(os.path.join(REPO_DIR, 'verbs_Cicero.json'),
+                                       os.path.join(REPO_DIR, 'irregular_paradigms.json'))
+        verbs = [db.verbs[lemma] for lemma in sorted(db.verbs)]
+
+        def generate():
+            for verb in verbs:
+                verb.generate_paradigm()
+
+        def build():
+            for verb in verbs:
+                db.build_paradigm(verb)
+
+        generate_seconds = best_of(args.rounds, generate)
+        build_seconds = best_of(args.rounds, build)
+        generate_blocks, generate_peak = allocations(verbs, lambda verb: verb.generate_paradigm())
+        build_blocks, build_peak = allocations(verbs, db.build_paradigm)
+    invalidated, report = paradigm_edit_invalidates(sorted(db.verbs)[::50])
+
+    print(f"{len(verbs)} verbs, best of {args.rounds} rounds")
+    print(f"  Verb.generate_paradigm  {generate_seconds / len(verbs) * 1e6:8.1f} µs per verb"
+          f"  {generate_blocks:7.0f} live blocks  {generate_peak / 1024:6.1f} KiB peak")
+    print(f"  LatinDB.build_paradigm  {build_seconds / len(verbs) * 1e6:8.1f} µs per verb"
+          f"  {build_blocks:7.0f} live blocks  {build_peak / 1024:6.1f} KiB peak")
+    print("Derived artefacts after a change to paradigm.py:")
+    print("\n".join(report))
+    if not invalidated:
+        print("  FAILED: the edited engine reused stale artefacts")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Speed of macronize() over every form the lexicon generates, checked against the stepwise rules.
+
+Records each word build_paradigm passes to macronize() for the whole Cicero
+lexicon, in call order. Then it checks that macronize() and macronize_stepwise()
+agree on every distinct word, plus a few constructed edge cases, and times
+three ways of running the recorded sequence:
+- the stepwise rules;
+- macronize() with an empty memo;
+- macronize() on each verb's words right after they were generated, as when
+  a paradigm is rebuilt.
+Exits with status 1 on any mismatch.
+
+    python benchmarks/bench_macronize.py [--rounds N]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import latin_engine  # noqa: E402
+
+EDGE_CASES = ['', 'ā', 'ām', 'āā', 'āām', 'āāa', 'āāāa', 'ōō', 'ēīnt', 'āntā', 'ārēt', 'īēr', 'Āa', 'ānd', 'āmn']
+
+
+def record_words(db):
+    """The words passed to macronize(), one list per verb."""
+    per_verb = []
+    macronize = latin_engine.macronize
+
+    def recording(word):
+        per_verb[-1].append(word)
+        return macronize(word)
+
+    latin_engine.macronize = recording
+    try:
+        for lemma in sorted(db.verbs):
+            per_verb.append([])
+            db.build_paradigm(db.verbs[lemma])
+    finally:
+        latin_engine.macronize = macronize
+    return per_verb
+
+
+def best_of(rounds, run, before=None):
+    best = float('inf')
+    for _ in range(rounds):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        db = latin_engine.load_lexicon(os.path.join(REPO_DIR, 'verbs_Cicero.json'),
+                                       os.path.join(REPO_DIR, 'irregular_paradigms.json'))
+        per_verb = record_words(db)
+    words = [word for verb_words in per_verb for word in verb_words]
+
+    macronize = latin_engine.macronize
+    stepwise = latin_engine.macronize_stepwise
+    distinct = set(words) | set(EDGE_CASES)
+    macronize.cache_clear()
+    mismatches = sorted(word for word in distinct if macronize(word) != stepwise(word))
+
+    def run(function):
+        return lambda: [function(word) for word in words]
+
+    stepwise_seconds = best_of(args.rounds, run(stepwise))
+    cold_seconds = best_of(args.rounds, run(macronize), before=macronize.cache_clear)
+    macronize.cache_clear()
+    warm_seconds = float('inf')
+    for _ in range(args.rounds):
+        macronize.cache_clear()
+        seconds = 0.0
+        for verb_words in per_verb:
+            for word in verb_words:
+                macronize(word)
+            started = time.perf_counter()
+            for word in verb_words:
+                macronize(word)
+            seconds += time.perf_counter() - started
+        warm_seconds = min(warm_seconds, seconds)
+
+    print(f"{len(words):,} calls, {len(distinct):,} distinct words, best of {args.rounds} rounds")
+    print(f"  mismatches with macronize_stepwise: {len(mismatches)}")
+    for word in mismatches[:10]:
+        print(f"    {word!r}: {macronize(word)!r} != {stepwise(word)!r}")
+    print(f"  stepwise rules          {stepwise_seconds / len(words) * 1e9:8.0f} ns per call")
+    print(f"  macronize, cold memo    {cold_seconds / len(words) * 1e9:8.0f} ns per call")
+    print(f"  macronize, rebuild      {warm_seconds / len(words) * 1e9:8.0f} ns per call"
+          f"  (memo of {macronize.cache_info().maxsize:,} words)")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
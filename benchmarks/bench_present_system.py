@@ -0,0 +1,182 @@
+"""Speed of the present-system suffix tables, checked against the conjugation code they replaced.
+
+Keeps a frozen copy of Verb._conjugate_present, _conjugate_imperfect and
+_conjugate_future as they were before the precompiled suffix tables: vowel
+dicts per call, endings joined to the stem one by one, every word shortened
+whole. generate_paradigm() is run for every verb of the Cicero lexicon with
+the engine's methods and again with the frozen ones; the paradigms must be
+identical. Then both versions of the ten present-system tenses are timed.
+Exits with status 1 on any difference.
+
+    python benchmarks/bench_present_system.py [--rounds N]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import latin_engine  # noqa: E402
+from latin_engine import PLACEHOLDER_6, macronize_alternatives, pack_alternatives  # noqa: E402
+from paradigm_store import flatten_paradigm  # noqa: E402
+
+TENSES = [('present', 'ind'), ('present', 'subj'), ('imperfect', 'ind'), ('imperfect', 'subj'), ('future', 'ind')]
+
+
+# --- Frozen reference: the present system before the suffix tables ---
+
+def reference_present(self, mood, voice):
+    if self.conjugation not in [1, 2, 3, 3.5, 4]: return PLACEHOLDER_6
+    stem = self.present_stem
+    ends = self.endings['person'][voice]
+    if mood == 'subj':
+        vowel = {'1': 'ē', '2': 'eā', '3': 'ā', '3.5': 'iā', '4': 'iā'}.get(str(self.conjugation))
+        if self.conjugation == 2 and voice == 'active': vowel = 'ea'
+        full_stem = stem + (vowel or '')
+        return [macronize_alternatives(f) for f in self._combine(full_stem, ends)]
+    forms = [self.p1 if voice == 'active' else (self.p1[:-1] + 'or' if self.p1.endswith('ō') else self.p1)]
+    for i, end in enumerate(ends[1:]):
+        person = i + 2
+        form_base = ""
+        if self.conjugation in [1, 2, 4]:
+            theme_vowel = {'1': 'ā', '2': 'ē', '4': 'ī'}.get(str(self.conjugation))
+            form_base = stem + theme_vowel
+        elif self.conjugation in [3, 3.5]:
+            vowel_map = {'active': {2: 'i', 3: 'i', 4: 'i', 5: 'i', 6: 'u'},
+                         'passive': {2: 'e', 3: 'i', 4: 'i', 5: 'i', 6: 'u'}}
+            vowel = vowel_map[voice][person]
+            if self.conjugation == 3.5 and not (voice == 'passive' and person == 2): vowel = 'iu' if person == 6 else 'i'
+            form_base = stem + vowel
+        forms.append(form_base + (end[0] if isinstance(end, list) else end))
+    final_forms = []
+    for i, form in enumerate(forms):
+        ending = ends[i]
+        if isinstance(ending, list):
+            stem_part = form[:-len(ending[0])]
+            final_forms.append(pack_alternatives([stem_part + alt for alt in ending]))
+        else:
+            final_forms.append(form)
+    return [macronize_alternatives(f) for f in final_forms]
+
+
+def reference_imperfect(self, mood, voice):
+    if self.conjugation not in [1, 2, 3, 3.5, 4]: return PLACEHOLDER_6
+    stem = self.present_stem
+    ends = self.endings['person'][voice]
+    if mood == 'ind':
+        vowel = {'1': 'ā', '2': 'ē', '3': 'ē', '3.5': 'iē', '4': 'iē'}.get(str(self.conjugation))
+        full_stem = stem + (vowel or '') + 'bā'
+        return [macronize_alternatives(f) for f in self._combine(full_stem, ends)]
+    elif mood == 'subj':
+        infinitive = self.p2
+        if self.is_deponent:
+            theme = {'1': 'āre', '2': 'ēre', '3': 'ere', '3.5': 'ere', '4': 'īre'}.get(str(self.conjugation))
+            infinitive = stem + (theme or '')
+        return [macronize_alternatives(f) for f in self._combine(infinitive, ends)]
+
+
+def reference_future(self, mood, voice):
+    if self.conjugation not in [1, 2, 3, 3.5, 4]: return PLACEHOLDER_6
+    if mood == 'subj': return []
+    stem = self.present_stem
+    ends = self.endings['person'][voice]
+    if self.conjugation in [1, 2]:
+        vowel = 'ā' if self.conjugation == 1 else 'ē'
+        forms = [stem + vowel + ('bō' if voice == 'active' else 'bor')]
+        second_person_base = stem + vowel + 'be'
+        forms.append(self._combine(second_person_base, [ends[1]])[0])
+        forms.append(stem + vowel + 'bi' + ends[2])
+        forms.append(stem + vowel + 'bi' + ends[3])
+        forms.append(stem + vowel + 'bi' + ends[4])
+        forms.append(stem + vowel + 'bu' + ends[5])
+        return [macronize_alternatives(f) for f in forms]
+    else:
+        vowel = 'i' if self.conjugation in [3.5, 4] else ''
+        forms = [stem + vowel + 'a' + ends[0]]
+        forms.extend(self._combine(stem + vowel + 'ē', ends[1:]))
+        return [macronize_alternatives(f) for f in forms]
+
+
+ENGINE = {'present': latin_engine.Verb._conjugate_present, 'imperfect': latin_engine.Verb._conjugate_imperfect,
+          'future': latin_engine.Verb._conjugate_future}
+REFERENCE = {'present': reference_present, 'imperfect': reference_imperfect, 'future': reference_future}
+
+
+@contextlib.contextmanager
+def conjugating_with(methods):
+    """Runs the block with `methods` installed as Verb's present-system methods."""
+    for tense, method in methods.items():
+        setattr(latin_engine.Verb, f'_conjugate_{tense}', method)
+    try:
+        yield
+    finally:
+        for tense, method in ENGINE.items():
+            setattr(latin_engine.Verb, f'_conjugate_{tense}', method)
+
+
+def best_of(rounds, run):
+    best = float('inf')
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def differences(engine_paradigm, reference_paradigm):
+    """(path, engine value, reference value) for every leaf where the two paradigms differ."""
+    engine_cells = dict(flatten_paradigm(engine_paradigm))
+    reference_cells = dict(flatten_paradigm(reference_paradigm))
+    return [(path, engine_cells.get(path), reference_cells.get(path))
+            for path in dict.fromkeys([*reference_cells, *engine_cells])
+            if engine_cells.get(path) != reference_cells.get(path)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        db = latin_engine.load_lexicon(os.path.join(REPO_DIR, 'verbs_Cicero.json'),
+                                       os.path.join(REPO_DIR, 'irregular_paradigms.json'))
+    verbs = [db.verbs[lemma] for lemma in sorted(db.verbs)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine_paradigms = [verb.generate_paradigm() for verb in verbs]
+        with conjugating_with(REFERENCE):
+            reference_paradigms = [verb.generate_paradigm() for verb in verbs]
+    wrong = [(verb.lemma, differences(mine, theirs))
+             for verb, mine, theirs in zip(verbs, engine_paradigms, reference_paradigms) if mine != theirs]
+
+    calls = [(tense, mood, voice) for tense, mood in TENSES for voice in ('active', 'passive')]
+
+    def conjugate(methods):
+        def run():
+            for verb in verbs:
+                for tense, mood, voice in calls:
+                    methods[tense](verb, mood, voice)
+        return run
+
+    engine_seconds = best_of(args.rounds, conjugate(ENGINE))
+    reference_seconds = best_of(args.rounds, conjugate(REFERENCE))
+    fallback = sum(1 for verb in verbs if latin_engine.LONG_VOWEL_TAIL_RE.search(verb.present_stem))
+
+    print(f"{len(verbs)} verbs, best of {args.rounds} rounds")
+    print(f"  paradigms differing from the frozen reference: {len(wrong)}")
+    for lemma, cells in wrong[:10]:
+        for path, mine, theirs in cells[:3]:
+            print(f"    {lemma} {'/'.join(path)}: {mine!r} != {theirs!r}")
+    print(f"  stems shortened word by word: {fallback}")
+    print(f"  present system, suffix tables   {engine_seconds / len(verbs) * 1e6:8.1f} µs per verb ({len(calls)} tenses)")
+    print(f"  present system, frozen code     {reference_seconds / len(verbs) * 1e6:8.1f} µs per verb")
+    if wrong:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Stem-and-ending analyzer against the full-form index: build time, memory, latency.
+
+Also checks that the two indexes agree on every form, that analyze_verified()
+confirms the analyses of sampled forms, and that it rejects an analysis the
+trie gives but the engine does not generate: an index built from a stale
+paradigm holding a made-up form. Exits with status 1 if that check fails.
+
+    python benchmarks/bench_segment_index.py [--lookups N]
+"""
+import argparse
+import collections
+import contextlib
+import copy
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import latin_engine  # noqa: E402
+from form_analyzer import FormIndex, SegmentIndex  # noqa: E402
+
+
+def measure(index_class, db):
+    started = time.perf_counter()
+    index_class.build(db)
+    build_seconds = time.perf_counter() - started
+    tracemalloc.start()
+    index = index_class.build(db)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return index, build_seconds, retained
+
+
+def time_lookups(index, queries):
+    started = time.perf_counter()
+    for form in queries:
+        index.analyze(form)
+    return (time.perf_counter() - started) / len(queries)
+
+
+def stale_form_rejected(db, lemma='amō', tense=('INDICATIVE ACTIVE', 'Imperfect'), stale='amāvēbam'):
+    """
+    Indexes `lemma` from a copy of its paradigm whose first person of `tense` is a form the
+    engine does not generate. True if analyze() reports that form and analyze_verified()
+    rejects it while still confirming the second person, left as generated.
+    """
+    verb = db.find_verb(lemma)
+    paradigm = copy.deepcopy(db.build_paradigm(verb))
+    forms = paradigm[tense[0]][tense[1]]
+    forms[0] = stale
+    index = SegmentIndex()
+    index.add_paradigm(lemma, paradigm, (verb.present_stem, verb.perfect_stem, verb.supine_stem))
+    return (bool(index.analyze(stale)) and not index.analyze_verified(db, stale)
+            and bool(index.analyze_verified(db, forms[1].split(' / ')[0])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        db = latin_engine.load_lexicon(os.path.join(REPO_DIR, 'verbs_Cicero.json'),
+                                       os.path.join(REPO_DIR, 'irregular_paradigms.json'))
+        full, full_build, full_retained = measure(FormIndex, db)
+        segments, segment_build, segment_retained = measure(SegmentIndex, db)
+
+    forms = list(full.forms())
+    rng = random.Random(0)
+    hits = rng.choices(forms, k=args.lookups)
+    misses = [form[:-1] + 'q' for form in hits]
+    disagreements = sum(collections.Counter(full.analyze(form)) != collections.Counter(segments.analyze(form))
+                        for form in forms)
+    sample = rng.sample(hits, 200)
+    unverified = sum(len(segments.analyze(form)) - len(segments.analyze_verified(db, form)) for form in sample)
+    rejected = stale_form_rejected(db)
+
+    print(f"{len(full.lemmas)} verbs, {len(full):,} distinct forms")
+    print(f"{'':24}{'FormIndex':>12}{'SegmentIndex':>14}")
+    print(f"{'build (s)':24}{full_build:12.2f}{segment_build:14.2f}")
+    print(f"{'memory (MiB retained)':24}{full_retained / 2**20:12.1f}{segment_retained / 2**20:14.1f}")
+    print(f"{'hit lookup (µs)':24}{time_lookups(full, hits) * 1e6:12.2f}"
+          f"{time_lookups(segments, hits) * 1e6:14.2f}")
+    print(f"{'miss lookup (µs)':24}{time_lookups(full, misses) * 1e6:12.2f}"
+          f"{time_lookups(segments, misses) * 1e6:14.2f}")
+    print("SegmentIndex contents: " + ", ".join(f"{n:,} {what}" for what, n in segments.sizes().items()))
+    print(f"Forms analysed differently: {disagreements:,}; "
+          f"analyses of {len(sample)} sampled forms failing regeneration: {unverified}")
+    print(f"Made-up form from a stale paradigm rejected by analyze_verified: {'yes' if rejected else 'NO'}")
+    if not rejected:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Cold lexicon load: JSON parse and indexing versus the compiled snapshot.
+
+Each sample runs in a fresh interpreter. The snapshot is written to a temporary
+directory first, so the benchmark never touches the one next to the lexicon.
+
+    python benchmarks/bench_snapshot.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAD_PROBE = (
+    "import contextlib, io, sys, time\n"
+    "import latin_engine\n"
+    "snapshot_path = sys.argv[1] or None\n"
+    "t0 = time.perf_counter()\n"
+    "with contextlib.redirect_stdout(io.StringIO()):\n"
+    "    db = latin_engine.load_lexicon(snapshot_path=snapshot_path)\n"
+    "print(time.perf_counter() - t0)\n"
+)
+
+
+def time_cold_load(runs, snapshot_path):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", LOAD_PROBE, snapshot_path or ""], cwd=REPO_DIR,
+                             capture_output=True, text=True, check=True).stdout
+        samples.append(float(out))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "verbs_Cicero.snapshot")
+        time_cold_load(1, snapshot_path)  # builds the snapshot
+        results = {
+            "JSON": time_cold_load(args.runs, None),
+            "snapshot": time_cold_load(args.runs, snapshot_path),
+        }
+
+    print(f"Cold load_lexicon() ({args.runs} runs each)")
+    for label, samples in results.items():
+        print(f"  {label:<9} min {min(samples) * 1000:8.2f} ms   median {statistics.median(samples) * 1000:8.2f} ms")
+    speedup = statistics.median(results["JSON"]) / statistics.median(results["snapshot"])
+    print(f"  snapshot speed-up: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Cold-start time and memory of the headless engine import and lexicon load.
+
+Each sample runs in a fresh interpreter so nothing is served from an already
+populated ``sys.modules``. Run from anywhere:
+
+    python benchmarks/bench_startup.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = (
+    "import sys, time\n"
+    "t0 = time.perf_counter()\n"
+    "import latin_engine\n"
+    "elapsed = time.perf_counter() - t0\n"
+    "gui = sorted(m for m in ('tkinter', 'pyglet') if m in sys.modules)\n"
+    "print(elapsed, ','.join(gui))\n"
+)
+
+LOAD_PROBE = (
+    "import contextlib, io, time\n"
+    "import latin_engine\n"
+    "t0 = time.perf_counter()\n"
+    "with contextlib.redirect_stdout(io.StringIO()):\n"
+    "    db = latin_engine.load_lexicon()\n"
+    "print(time.perf_counter() - t0)\n"
+)
+
+MEMORY_PROBE = (
+    "import contextlib, io, tracemalloc\n"
+    "import latin_engine\n"
+    "tracemalloc.start()\n"
+    "with contextlib.redirect_stdout(io.StringIO()):\n"
+    "    db = latin_engine.load_lexicon()\n"
+    "print(tracemalloc.get_traced_memory()[0])\n"
+)
+
+
+def time_cold_import(runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", IMPORT_PROBE], cwd=REPO_DIR,
+                             capture_output=True, text=True, check=True).stdout.split()
+        if len(out) > 1:
+            raise SystemExit(f"Headless import pulled in GUI modules: {out[1]}")
+        samples.append(float(out[0]))
+    return samples
+
+
+def time_cold_load(runs):
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", LOAD_PROBE], cwd=REPO_DIR,
+                             capture_output=True, text=True, check=True).stdout
+        samples.append(float(out))
+    return samples
+
+
+def measure_load_memory():
+    out = subprocess.run([sys.executable, "-c", MEMORY_PROBE], cwd=REPO_DIR,
+                         capture_output=True, text=True, check=True).stdout
+    return int(out)
+
+
+def report(title, samples):
+    print(title)
+    print(f"  min    {min(samples) * 1000:8.2f} ms")
+    print(f"  median {statistics.median(samples) * 1000:8.2f} ms")
+    print(f"  max    {max(samples) * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    report(f"import latin_engine ({args.runs} cold runs)", time_cold_import(args.runs))
+    report(f"load_lexicon() ({args.runs} cold runs)", time_cold_load(args.runs))
+    print(f"memory retained by load_lexicon(): {measure_load_memory() / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Bytes per built Verb for the whole Cicero lexicon.
+
+The raw lexicon entries are loaded first, so only what building the Verb
+objects adds on top of them is counted.
+
+    python benchmarks/bench_verb_memory.py
+"""
+import contextlib
+import io
+import os
+import sys
+import tracemalloc
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import latin_engine  # noqa: E402
+
+
+def main():
+    with contextlib.redirect_stdout(io.StringIO()):
+        db = latin_engine.load_lexicon(os.path.join(REPO_DIR, 'verbs_Cicero.json'),
+                                       os.path.join(REPO_DIR, 'irregular_paradigms.json'))
+    lemmas = list(db.verbs)
+
+    tracemalloc.start()
+    verbs = [db.verbs[lemma] for lemma in lemmas]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{len(verbs)} verbs built, {retained / 1024:,.0f} KiB retained")
+    print(f"  {retained / len(verbs):,.0f} bytes per verb")
+
+
+if __name__ == "__main__":
+    main()
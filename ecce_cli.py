@@ -0,0 +1,233 @@
+"""Headless command-line front-end of the ECCE LOGOS engine.
+
+    python ecce_cli.py build-store [--output PATH]
+    python ecce_cli.py batch [LEMMA ...] [--tag TAG ...] [--any-tag TAG ...] [--exclude-tag TAG ...]
+                                   [--format ndjson|csv] [--workers N]
+    python ecce_cli.py serve [--store PATH] [--disk-cache PATH] < queries.ndjson
+    python ecce_cli.py analyze [--plain | --segments | --verify] [FORM ...] < forms.txt
+    python ecce_cli.py lemmatize [FILE ...] [--workers N] < corpus.txt
+    python ecce_cli.py restore [FILE ...] [--report PATH] < plain.txt
+
+Diagnostics go to stderr so that stdout only ever carries results.
+"""
+import argparse
+import contextlib
+import json
+import sys
+import time
+
+from latin_engine import load_lexicon
+from lexicon_snapshot import default_snapshot_path, hash_sources
+import paradigm_store
+import batch
+import service
+from form_analyzer import FormIndex, SegmentIndex, DemacronizedFormIndex
+import lemmatizer
+import macron_restorer
+
+
+def load_db(args, **options):
+    snapshot_path = None if args.no_snapshot else default_snapshot_path(args.verbs)
+    with contextlib.redirect_stdout(sys.stderr):
+        db = load_lexicon(args.verbs, args.irregular, snapshot_path=snapshot_path, **options)
+    if db is None or not db.verbs:
+        raise SystemExit("Could not load the verb database.")
+    return db
+
+
+def cmd_build_store(args):
+    db = load_db(args)
+    output = args.output or paradigm_store.default_store_path(args.verbs)
+
+    def progress(done, total):
+        if done % 250 == 0 or done == total:
+            print(f"  {done}/{total} paradigms", file=sys.stderr)
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        paradigm_store.build_store(db, output, source_hashes=hash_sources(args.verbs, args.irregular),
+                                   progress=progress)
+    with paradigm_store.ParadigmStore(output) as store:
+        size = sum(length for _, length in store.header['sections'].values())
+        print(f"Wrote {len(store)} paradigms ({len(store.cells)} cells each, {size / 2**20:.1f} MiB) "
+              f"to '{output}' in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+
+
+def cmd_batch(args):
+    db = load_db(args)
+    lemmas = sorted(args.lemmas or db.verbs)
+    unknown = [lemma for lemma in lemmas if lemma not in db.verbs]
+    if unknown:
+        raise SystemExit(f"Unknown lemma(s): {', '.join(unknown)}")
+    if args.tag or args.any_tag or args.exclude_tag:
+        bits = db.tag_index.select(args.tag or (), args.any_tag or (), args.exclude_tag or ())
+        lemmas = [lemma for lemma in lemmas if db.tag_index.has(bits, lemma)]
+
+    snapshot_path = None if args.no_snapshot else default_snapshot_path(args.verbs)
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        verbs, forms, seconds = batch.generate_batch(lemmas, out, args.verbs, args.irregular, snapshot_path,
+                                                     fmt=args.format, workers=args.workers,
+                                                     chunk_size=args.chunk_size)
+    finally:
+        if args.output:
+            out.close()
+    print(f"Generated {verbs} paradigms ({forms} forms) in {seconds:.2f} s: "
+          f"{verbs / seconds:,.1f} verbs/s, {forms / seconds:,.0f} forms/s", file=sys.stderr)
+
+
+def cmd_serve(args):
+    db = load_db(args, paradigm_cache_size=args.cache_size, disk_cache_path=args.disk_cache)
+    store = None
+    if args.store:
+        store = paradigm_store.ParadigmStore(args.store)
+        if not store.is_fresh(hash_sources(args.verbs, args.irregular)):
+            print(f"Warning: '{args.store}' is stale; rebuild it with build-store. Ignoring it.", file=sys.stderr)
+            store.close()
+            store = None
+    print("Ready.", file=sys.stderr)
+    # Generation code may print diagnostics; keep them off the response stream.
+    out = sys.stdout
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            served = service.serve(db, sys.stdin, out, store)
+    finally:
+        if store is not None:
+            store.close()
+    print(f"Served {served} queries.", file=sys.stderr)
+
+
+def cmd_analyze(args):
+    db = load_db(args)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        index = (SegmentIndex if args.segments or args.verify else FormIndex).build(db)
+    plain_index = DemacronizedFormIndex(index) if args.plain else None
+    print(f"Indexed the lexicon in {time.perf_counter() - started:.1f} s.", file=sys.stderr)
+    forms = args.forms or (line.strip() for line in iter(sys.stdin.readline, ''))
+    for form in forms:
+        if not form:
+            continue
+        if plain_index is not None:
+            result = {'form': form, 'candidates': [
+                {'form': candidate, 'analyses': [a._asdict() for a in analyses]}
+                for candidate, analyses in plain_index.analyze(form)]}
+        elif args.verify:
+            with contextlib.redirect_stdout(sys.stderr):  # regeneration may print diagnostics
+                analyses = index.analyze_verified(db, form)
+            result = {'form': form, 'analyses': [a._asdict() for a in analyses]}
+        else:
+            result = {'form': form, 'analyses': [a._asdict() for a in index.analyze(form)]}
+        sys.stdout.write(json.dumps(result, ensure_ascii=False) + '\n')
+        sys.stdout.flush()
+
+
+def cmd_lemmatize(args):
+    db = load_db(args)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        index = lemmatizer.build_corpus_index(db)
+    print(f"Indexed the lexicon in {time.perf_counter() - started:.1f} s.", file=sys.stderr)
+    with contextlib.ExitStack() as stack:
+        if args.files:
+            files = [stack.enter_context(open(path, encoding='utf-8')) for path in args.files]
+            lines = (line for f in files for line in f)
+        else:
+            lines = iter(sys.stdin.readline, '')
+        if args.workers and args.workers > 1:
+            snapshot_path = None if args.no_snapshot else default_snapshot_path(args.verbs)
+            results = lemmatizer.lemmatize_parallel(lines, args.workers, args.verbs, args.irregular,
+                                                    snapshot_path=snapshot_path, index=index)
+        else:
+            results = lemmatizer.lemmatize(lines, index)
+        tokens = 0
+        started = time.perf_counter()
+        for result in results:
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + '\n')
+            tokens += 1
+    seconds = time.perf_counter() - started
+    print(f"Lemmatized {tokens:,} tokens in {seconds:.1f} s.", file=sys.stderr)
+
+
+def cmd_restore(args):
+    db = load_db(args)
+    with contextlib.redirect_stdout(sys.stderr):
+        index = lemmatizer.build_corpus_index(db)
+    with contextlib.ExitStack() as stack:
+        report = stack.enter_context(open(args.report, 'w', encoding='utf-8')) if args.report else None
+
+        def on_ambiguous(line_no, token, spellings):
+            if report is not None:
+                report.write(json.dumps({'line': line_no, 'token': token, 'candidates': spellings},
+                                        ensure_ascii=False) + '\n')
+
+        if args.files:
+            files = [stack.enter_context(open(path, encoding='utf-8')) for path in args.files]
+            lines = (line for f in files for line in f)
+        else:
+            lines = iter(sys.stdin.readline, '')
+        stats = macron_restorer.RestorationStats()
+        for line in macron_restorer.restore_lines(lines, index, stats, on_ambiguous):
+            sys.stdout.write(line)
+    print(stats.summary(), file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Headless ECCE LOGOS engine.")
+    parser.add_argument('--verbs', default='verbs_Cicero.json', help="verb lexicon (JSON)")
+    parser.add_argument('--irregular', default='irregular_paradigms.json', help="irregular paradigms (JSON)")
+    parser.add_argument('--no-snapshot', action='store_true', help="always parse the JSON lexicon")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build-store', help="precompute every paradigm into a memory-mapped store")
+    build.add_argument('--output', help="store file (default: next to the lexicon)")
+    build.set_defaults(func=cmd_build_store)
+
+    gen = commands.add_parser('batch', help="generate paradigms for the whole lexicon or a subset")
+    gen.add_argument('lemmas', nargs='*', help="lemmas to generate (default: every verb)")
+    gen.add_argument('--tag', action='append',
+                     help="only verbs carrying this tag (repeatable, all must match); "
+                          "a family such as 'compound' or a pattern such as 'compound(ab+*)' also works")
+    gen.add_argument('--any-tag', action='append', help="only verbs carrying at least one of these tags (repeatable)")
+    gen.add_argument('--exclude-tag', action='append', help="skip verbs carrying this tag (repeatable)")
+    gen.add_argument('--format', choices=batch.FORMATS, default='ndjson')
+    gen.add_argument('--output', help="output file (default: stdout)")
+    gen.add_argument('--workers', type=int, help="worker processes (default: one per CPU)")
+    gen.add_argument('--chunk-size', type=int, default=32, help="lemmas per work unit")
+    gen.set_defaults(func=cmd_batch)
+
+    srv = commands.add_parser('serve', help="answer NDJSON queries from stdin, one JSON paradigm per line")
+    srv.add_argument('--store', help="serve precomputed paradigms from this store file when fresh")
+    srv.add_argument('--disk-cache', help="persistent SQLite paradigm cache")
+    srv.add_argument('--cache-size', type=int, default=1024, help="in-memory LRU size (paradigms)")
+    srv.set_defaults(func=cmd_serve)
+
+    ana = commands.add_parser('analyze', help="list every analysis of inflected forms")
+    ana.add_argument('forms', nargs='*', help="forms to analyse (default: one per line on stdin)")
+    mode = ana.add_mutually_exclusive_group()
+    mode.add_argument('--plain', action='store_true', help="input has no macrons: list every macronized candidate")
+    mode.add_argument('--segments', action='store_true',
+                      help="use the stem-and-ending analyzer (a fraction of the memory, slightly slower)")
+    mode.add_argument('--verify', action='store_true',
+                      help="like --segments, but regenerate each candidate's paradigm and drop analyses it does not confirm")
+    ana.set_defaults(func=cmd_analyze)
+
+    lem = commands.add_parser('lemmatize', help="stream every token of running text with its analyses")
+    lem.add_argument('files', nargs='*', help="UTF-8 text files (default: stdin)")
+    lem.add_argument('--workers', type=int, help="analyse on this many worker processes")
+    lem.set_defaults(func=cmd_lemmatize)
+
+    rst = commands.add_parser('restore', help="restore macrons in plain Latin text")
+    rst.add_argument('files', nargs='*', help="UTF-8 text files (default: stdin)")
+    rst.add_argument('--report', help="write every ambiguous word and its candidates here (NDJSON)")
+    rst.set_defaults(func=cmd_restore)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+"""Reverse morphology: inflected form -> every (lemma, category, tense, slot) it can be.
+
+FormIndex is a full-form hash index built by assembling each lexicon verb's
+paradigm once (Verb.generate_paradigm, the irregular paradigms, the archaic
+generators and the participle declensions, i.e. LatinDB.build_paradigm) and
+recording every alternative of every cell. Analysing a form is then a single
+dict probe; nothing is regenerated. Derived verbs (iteratives, inchoatives,
+desideratives) are not lexicon entries and are left out.
+
+SegmentIndex answers the same queries from stems, shared ending tables and a
+few exceptions, at a small fraction of the FormIndex's memory.
+
+DemacronizedFormIndex sits on top of a FormIndex and answers the same question
+for text written without macrons, where one spelling can stand for many forms.
+
+Periphrastic forms are indexed as the words a text would contain: 'āctī sunt /
+fuērunt' yields 'āctī sunt' and 'āctī fuērunt', and the participle agrees in
+any gender ('ācta est', 'āctum esse').
+"""
+from collections import namedtuple
+
+from latin_engine import demacronize
+from paradigm_store import flatten_paradigm, EMPTY_LIST, EMPTY_DICT
+
+Analysis = namedtuple('Analysis', 'lemma category tense slot')
+
+PERSON_LABELS = ('1st Sg', '2nd Sg', '3rd Sg', '1st Pl', '2nd Pl', '3rd Pl')
+IMPERATIVE_LABELS = ('2nd Sg', '3rd Sg', '2nd Pl', '3rd Pl')
+NON_FINITE_CATEGORIES = {'INFINITIVES': 'INFINITIVE', 'GERUND': 'GERUND',
+                         'GERUND (-undus form)': 'GERUND', 'SUPINE': 'SUPINE'}
+# Participle endings that agree with the subject of a periphrastic form.
+GENDER_VARIANTS = {'us': ('a', 'um'), 'ī': ('ae', 'a')}
+
+
+def describe_cell(path):
+    """(category, tense, slot) for a flattened paradigm path, or None if it holds no forms."""
+    if path[-1] in (EMPTY_LIST, EMPTY_DICT) or path[0] == 'DERIVED VERBS':
+        return None
+    category = path[0]
+    if category == 'NON-FINITE':
+        if path[1] == 'PARTICIPLES':
+            return 'PARTICIPLE', path[2], ' '.join(path[3:])
+        if path[1] == 'INFINITIVES':
+            return 'INFINITIVE', path[2], ''
+        return NON_FINITE_CATEGORIES.get(path[1], path[1]), '', path[2]
+    labels = IMPERATIVE_LABELS if category == 'IMPERATIVES' else PERSON_LABELS
+    index = int(path[2])
+    return category, path[1], labels[index] if index < len(labels) else str(index)
+
+
+def cell_texts(paradigm, cell):
+    """The texts one (category, tense, slot) cell holds in a nested paradigm; see describe_cell."""
+    category, tense, slot = cell
+    if category in paradigm and category != 'NON-FINITE':
+        forms = paradigm[category].get(tense)
+        labels = IMPERATIVE_LABELS if category == 'IMPERATIVES' else PERSON_LABELS
+        index = labels.index(slot) if slot in labels else int(slot)
+        if isinstance(forms, list) and index < len(forms) and isinstance(forms[index], str):
+            return [forms[index]]
+        return []
+    subtree, prefix = paradigm.get('NON-FINITE', {}), ('NON-FINITE',)
+    if category == 'PARTICIPLE':
+        subtree, prefix = subtree.get('PARTICIPLES', {}).get(tense, {}), prefix + ('PARTICIPLES', tense)
+    elif category == 'INFINITIVE':
+        subtree, prefix = subtree.get('INFINITIVES', {}).get(tense), prefix + ('INFINITIVES', tense)
+    return [text for path, text in flatten_paradigm(subtree, prefix)
+            if isinstance(text, str) and describe_cell(path) == cell]
+
+
+def auxiliary_forms(db):
+    """Every form of 'sum' that can follow a participle, plus the infinitive auxiliaries."""
+    forms = {'esse', 'fore', 'īrī'}
+    for _, text in flatten_paradigm(db.irregular_paradigms.get('sum', {})):
+        forms.update(f.strip() for f in text.split(' / ') if f.strip() and f.strip() != 'Ø')
+    return forms
+
+
+def expand_forms(text, auxiliaries):
+    """The individual surface forms written in one paradigm cell."""
+    alternatives = [a.strip() for a in text.split(' / ')]
+    head = []
+    for alt in alternatives:
+        if not alt or alt in ('Ø', '-'):
+            continue
+        words = alt.replace(', -a, -um', '').split()
+        if len(words) > 1:
+            head = words[:-1]
+        elif head and words[0] in auxiliaries:
+            # 'āctus sum / fuī': the bare auxiliary shares the participle of the first alternative.
+            words = head + words
+        yield ' '.join(words)
+        if len(words) > 1 and words[1] in auxiliaries:
+            for ending, variants in GENDER_VARIANTS.items():
+                if words[0].endswith(ending):
+                    stem = words[0][:-len(ending)]
+                    for variant in variants:
+                        yield ' '.join([stem + variant] + words[1:])
+
+
+def normalize_form(form):
+    return ' '.join(form.split()).lower()
+
+
+def plain_key(form):
+    """Lookup key for unmacronized input: the normalized form with every macron stripped."""
+    return normalize_form(demacronize(form))
+
+
+def add_packed(mapping, key, value):
+    """Adds `value` to the multi-valued `mapping[key]`: a bare value, or a tuple once there are several."""
+    existing = mapping.get(key)
+    if existing is None:
+        mapping[key] = value
+    elif isinstance(existing, tuple):
+        if value not in existing:
+            mapping[key] = existing + (value,)
+    elif existing != value:
+        mapping[key] = (existing, value)
+
+
+def unpack(found):
+    if found is None:
+        return ()
+    return found if isinstance(found, tuple) else (found,)
+
+
+class FormIndex:
+    """
+    Full-form index. Analyses are stored compactly: each distinct (category, tense, slot)
+    is interned once, and an analysis is the int  lemma_id << CELL_BITS | cell_id. A form
+    with a single analysis stores that int directly, otherwise a tuple of them.
+    """
+    CELL_BITS = 12
+
+    def __init__(self):
+        self.lemmas = []
+        self.cells = []
+        self._cell_ids = {}
+        self._forms = {}
+
+    @classmethod
+    def build(cls, db, lemmas=None, progress=None):
+        index = cls()
+        auxiliaries = auxiliary_forms(db)
+        lemmas = sorted(db.verbs) if lemmas is None else list(lemmas)
+        for n, lemma in enumerate(lemmas, 1):
+            index.add_paradigm(lemma, db.build_paradigm(db.find_verb(lemma)), auxiliaries)
+            if progress:
+                progress(n, len(lemmas))
+        return index
+
+    def add_paradigm(self, lemma, paradigm, auxiliaries):
+        lemma_id = len(self.lemmas)
+        self.lemmas.append(lemma)
+        for path, text in flatten_paradigm(paradigm):
+            cell = describe_cell(path)
+            if cell is None or not isinstance(text, str):
+                continue
+            cell_id = self._cell_ids.get(cell)
+            if cell_id is None:
+                cell_id = self._cell_ids[cell] = len(self.cells)
+                if cell_id >> self.CELL_BITS:
+                    raise ValueError("Too many distinct paradigm cells for FormIndex.CELL_BITS")
+                self.cells.append(cell)
+            for form in expand_forms(text, auxiliaries):
+                self._add(normalize_form(form), lemma_id << self.CELL_BITS | cell_id)
+
+    def _add(self, form, analysis):
+        add_packed(self._forms, form, analysis)
+
+    def _decode(self, analysis):
+        cell = self.cells[analysis & ((1 << self.CELL_BITS) - 1)]
+        return Analysis(self.lemmas[analysis >> self.CELL_BITS], *cell)
+
+    def analyze(self, form):
+        """Every analysis of `form` (macrons significant; case and spacing are not)."""
+        found = self._forms.get(normalize_form(form))
+        if found is None:
+            return []
+        if isinstance(found, tuple):
+            return [self._decode(a) for a in found]
+        return [self._decode(found)]
+
+    def __contains__(self, form):
+        return normalize_form(form) in self._forms
+
+    def __len__(self):
+        return len(self._forms)
+
+    def forms(self):
+        return self._forms.keys()
+
+
+class SegmentIndex:
+    """
+    Stem-and-ending analyzer that never materialises the form space. Each paradigm is
+    streamed through once and every form is split into the longest of its verb's present,
+    perfect or supine stems plus an ending. A verb's table for one stem, {ending: cell ids},
+    is interned: the whole lexicon needs only a few hundred distinct tables, so the index
+    holds about three stems per verb instead of every form. Forms that begin with none of
+    their verb's stems (irregular paradigms, a long stem vowel shortened before the
+    ending) are kept whole in a small exceptions dict.
+
+    analyze() walks a trie of reversed endings from the end of the form. At every split
+    where an ending stops, the prefix is looked up in the stem hash and the ending in the
+    tables of the stems found. Since each table was read off the verb's own paradigm the
+    answer is the FormIndex's as long as the index is as fresh as the engine and lexicon.
+    analyze_verified() does not rely on that: it regenerates the paradigm of every lemma a
+    candidate names and keeps only the analyses whose cell really holds the form.
+    """
+    CELL_BITS = FormIndex.CELL_BITS
+    TABLE_BITS = 12
+
+    def __init__(self):
+        self.lemmas = []
+        self.cells = []
+        self._cell_ids = {}
+        self.tables = []
+        self._table_ids = {}
+        self._stems = {}
+        self._exceptions = {}
+        self._endings = {}
+        self._auxiliaries = set()
+
+    @classmethod
+    def build(cls, db, lemmas=None, progress=None):
+        index = cls()
+        index._auxiliaries = auxiliary_forms(db)
+        lemmas = sorted(db.verbs) if lemmas is None else list(lemmas)
+        for n, lemma in enumerate(lemmas, 1):
+            verb = db.find_verb(lemma)
+            index.add_paradigm(lemma, db.build_paradigm(verb),
+                               (verb.present_stem, verb.perfect_stem, verb.supine_stem))
+            if progress:
+                progress(n, len(lemmas))
+        return index
+
+    def _cell_id(self, cell):
+        cell_id = self._cell_ids.get(cell)
+        if cell_id is None:
+            cell_id = self._cell_ids[cell] = len(self.cells)
+            if cell_id >> self.CELL_BITS:
+                raise ValueError("Too many distinct paradigm cells for SegmentIndex.CELL_BITS")
+            self.cells.append(cell)
+        return cell_id
+
+    def _table_id(self, table):
+        key = frozenset(table.items())
+        table_id = self._table_ids.get(key)
+        if table_id is None:
+            table_id = self._table_ids[key] = len(self.tables)
+            if table_id >> self.TABLE_BITS:
+                raise ValueError("Too many distinct ending tables for SegmentIndex.TABLE_BITS")
+            self.tables.append(table)
+            for ending in table:
+                node = self._endings
+                for char in reversed(ending):
+                    node = node.setdefault(char, {})
+                node[None] = True
+        return table_id
+
+    def add_paradigm(self, lemma, paradigm, stems):
+        lemma_id = len(self.lemmas)
+        self.lemmas.append(lemma)
+        stems = sorted({stem for stem in stems if stem}, key=len, reverse=True)
+        segments = {stem: {} for stem in stems}
+        for path, text in flatten_paradigm(paradigm):
+            cell = describe_cell(path)
+            if cell is None or not isinstance(text, str):
+                continue
+            cell_id = self._cell_id(cell)
+            for form in expand_forms(text, self._auxiliaries):
+                form = normalize_form(form)
+                stem = next((stem for stem in stems if form.startswith(stem)), None)
+                if stem is None:
+                    add_packed(self._exceptions, form, lemma_id << self.CELL_BITS | cell_id)
+                else:
+                    add_packed(segments[stem], form[len(stem):], cell_id)
+        for stem, table in segments.items():
+            if table:
+                add_packed(self._stems, stem, lemma_id << self.TABLE_BITS | self._table_id(table))
+
+    def analyze(self, form):
+        """Every analysis of `form`, as FormIndex.analyze() gives it (order aside)."""
+        form = normalize_form(form)
+        cell_mask = (1 << self.CELL_BITS) - 1
+        found = [Analysis(self.lemmas[a >> self.CELL_BITS], *self.cells[a & cell_mask])
+                 for a in unpack(self._exceptions.get(form))]
+        table_mask = (1 << self.TABLE_BITS) - 1
+        node = self._endings
+        split = len(form)
+        while True:
+            if None in node:
+                ending = form[split:]
+                for entry in unpack(self._stems.get(form[:split])):
+                    for cell_id in unpack(self.tables[entry & table_mask].get(ending)):
+                        found.append(Analysis(self.lemmas[entry >> self.TABLE_BITS], *self.cells[cell_id]))
+            if split == 0:
+                break
+            split -= 1
+            node = node.get(form[split])
+            if node is None:
+                break
+        return found
+
+    def verify(self, db, form, analysis, paradigm=None):
+        """
+        True if the cell `analysis` names holds `form` in its lemma's paradigm, regenerated
+        with db.build_paradigm (no cache is consulted) unless `paradigm` is passed in.
+        """
+        if paradigm is None:
+            verb = db.find_verb(analysis.lemma)
+            if verb is None:
+                return False
+            paradigm = db.build_paradigm(verb)
+        form = normalize_form(form)
+        cell = (analysis.category, analysis.tense, analysis.slot)
+        return any(normalize_form(f) == form
+                   for text in cell_texts(paradigm, cell) for f in expand_forms(text, self._auxiliaries))
+
+    def analyze_verified(self, db, form):
+        """analyze(), keeping only the analyses verify() confirms; each lemma is regenerated once."""
+        paradigms = {}
+        verified = []
+        for analysis in self.analyze(form):
+            if analysis.lemma not in paradigms:
+                verb = db.find_verb(analysis.lemma)
+                paradigms[analysis.lemma] = None if verb is None else db.build_paradigm(verb)
+            paradigm = paradigms[analysis.lemma]
+            if paradigm is not None and self.verify(db, form, analysis, paradigm):
+                verified.append(analysis)
+        return verified
+
+    def __contains__(self, form):
+        return bool(self.analyze(form))
+
+    def sizes(self):
+        return {'stems': len(self._stems), 'tables': len(self.tables),
+                'table entries': sum(len(table) for table in self.tables),
+                'exceptions': len(self._exceptions)}
+
+
+class DemacronizedFormIndex:
+    """
+    Multi-valued index from macron-less spellings to every macronized form of a FormIndex
+    that shares them ('amas' -> 'amās', 'legere' -> 'legere', 'lēgēre', ...). Each key maps to
+    its precomputed candidates, so a lookup is one dict probe however many forms collide.
+    `key` decides which spellings count as the same; see lemmatizer.orthographic_key for a
+    looser one.
+    """
+
+    def __init__(self, form_index, key=plain_key):
+        self.form_index = form_index
+        self._key = key
+        groups = {}
+        for form in form_index.forms():
+            groups.setdefault(key(form), []).append(form)
+        # Most spellings are unambiguous; store those as a bare string rather than a 1-tuple.
+        self._candidates = {key: forms[0] if len(forms) == 1 else tuple(sorted(forms))
+                            for key, forms in groups.items()}
+
+    def candidates(self, form):
+        """Every macronized form spelled `form` once macrons, case and spacing are ignored."""
+        found = self._candidates.get(self._key(form))
+        if found is None:
+            return ()
+        return (found,) if isinstance(found, str) else found
+
+    def analyze(self, form):
+        """[(macronized form, [Analysis, ...]), ...] for every candidate of `form`."""
+        return [(candidate, self.form_index.analyze(candidate)) for candidate in self.candidates(form)]
+
+    def largest_collisions(self, n=10):
+        groups = (found for found in self._candidates.values() if isinstance(found, tuple))
+        return sorted(groups, key=len, reverse=True)[:n]
+
+    def __contains__(self, form):
+        return self._key(form) in self._candidates
+
+    def __len__(self):
+        return len(self._candidates)
@@ -0,0 +1,1586 @@
+"""Headless core of the ECCE LOGOS morphological engine.
+
+Everything needed to load the lexicon and generate paradigms lives here, so batch
+jobs and worker processes can import it without pulling in tkinter or pyglet.
+The desktop front-end in ``ecce-logos.py`` builds on top of this module.
+"""
+import re
+import copy
+import itertools
+import json
+import marshal
+import os
+import hashlib
+import functools
+from collections.abc import Mapping
+
+from tag_index import TagIndex
+from paradigm import alternatives, pack_alternatives, join_alternatives, merge_paradigms
+from paradigm_cache import ParadigmCache, DiskParadigmCache, DEFAULT_PARADIGM_CACHE_SIZE
+
+# Bump whenever a rule change alters generated stems or forms. Together with a hash of the
+# ENGINE_SOURCES it stamps every derived artefact (lexicon snapshots, paradigm caches, stores).
+ENGINE_VERSION = '1'
+
+# Every module whose code shapes what those artefacts hold: the conjugation rules, the paradigm
+# merge and packing helpers behind the 'sum' completion and build_paradigm, and the tag index
+# whose state is stored in lexicon snapshots.
+ENGINE_SOURCES = ('latin_engine.py', 'paradigm.py', 'tag_index.py')
+
+@functools.lru_cache(maxsize=None)
+def engine_fingerprint():
+    """ENGINE_VERSION plus a digest of the ENGINE_SOURCES, so editing any rule invalidates derived data."""
+    engine_dir = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in ENGINE_SOURCES:
+        with open(os.path.join(engine_dir, name), 'rb') as f:
+            digest.update(name.encode('utf-8') + b'\0' + hashlib.sha256(f.read()).digest())
+    return f"{ENGINE_VERSION}-{digest.hexdigest()[:16]}"
+
+# --- Universal Paradigm Template and Placeholders ---
+PLACEHOLDER_6 = ['Ø'] * 6
+PLACEHOLDER_4 = ['Ø'] * 4
+PLACEHOLDER_2 = ['Ø'] * 2
+PLACEHOLDER_STR = 'Ø'
+
+PARADIGM_TEMPLATE = {
+    'INDICATIVE ACTIVE': {
+        'Present': list(PLACEHOLDER_6), 'Imperfect': list(PLACEHOLDER_6), 'Future': list(PLACEHOLDER_6),
+        'Perfect': list(PLACEHOLDER_6), 'Pluperfect': list(PLACEHOLDER_6), 'Future Perfect': list(PLACEHOLDER_6)
+    },
+    'SUBJUNCTIVE ACTIVE': {
+        'Present': list(PLACEHOLDER_6), 'Imperfect': list(PLACEHOLDER_6),
+        'Perfect': list(PLACEHOLDER_6), 'Pluperfect': list(PLACEHOLDER_6)
+    },
+    'INDICATIVE PASSIVE': {
+        'Present': list(PLACEHOLDER_6), 'Imperfect': list(PLACEHOLDER_6), 'Future': list(PLACEHOLDER_6),
+        'Perfect': list(PLACEHOLDER_6), 'Pluperfect': list(PLACEHOLDER_6), 'Future Perfect': list(PLACEHOLDER_6)
+    },
+    'SUBJUNCTIVE PASSIVE': {
+        'Present': list(PLACEHOLDER_6), 'Imperfect': list(PLACEHOLDER_6),
+        'Perfect': list(PLACEHOLDER_6), 'Pluperfect': list(PLACEHOLDER_6)
+    },
+    'IMPERATIVES': {
+        'Pres Act': list(PLACEHOLDER_2), 'Pres Pass': list(PLACEHOLDER_2),
+        'Fut Act': list(PLACEHOLDER_4), 'Fut Pass': list(PLACEHOLDER_4)
+    },
+    'NON-FINITE': {
+        'INFINITIVES': {
+            'Pres Act': PLACEHOLDER_STR, 'Perf Act': PLACEHOLDER_STR, 'Fut Act': PLACEHOLDER_STR,
+            'Pres Pass': PLACEHOLDER_STR, 'Perf Pass': PLACEHOLDER_STR, 'Fut Pass': PLACEHOLDER_STR
+        },
+        'GERUND': {'Gen': PLACEHOLDER_STR, 'Dat': PLACEHOLDER_STR, 'Acc': PLACEHOLDER_STR, 'Abl': PLACEHOLDER_STR},
+        'GERUND (-undus form)': {'Gen': PLACEHOLDER_STR, 'Dat': PLACEHOLDER_STR, 'Acc': PLACEHOLDER_STR, 'Abl': PLACEHOLDER_STR},
+        'SUPINE': {'Acc': PLACEHOLDER_STR, 'Abl': PLACEHOLDER_STR},
+        'PARTICIPLES': {}
+    }
+}
+
+MASTER_TEMPLATE = {
+    'INDICATIVE ACTIVE': {
+        'Present': PLACEHOLDER_6, 'Imperfect': PLACEHOLDER_6, 'Future': PLACEHOLDER_6,
+        'Perfect': PLACEHOLDER_6, 'Pluperfect': PLACEHOLDER_6, 'Future Perfect': PLACEHOLDER_6,
+        'Future Perfect II (Archaic)': PLACEHOLDER_6,
+        'Future (Archaic -bō)': PLACEHOLDER_6,
+    },
+    'SUBJUNCTIVE ACTIVE': {
+        'Present': PLACEHOLDER_6, 'Imperfect': PLACEHOLDER_6,
+        'Perfect': PLACEHOLDER_6, 'Pluperfect': PLACEHOLDER_6,
+        'Aorist Subjunctive (Archaic)': PLACEHOLDER_6,
+        'Archaic Optative (Theoretical)': PLACEHOLDER_6,
+    },
+    'INDICATIVE PASSIVE': {
+        'Present': PLACEHOLDER_6, 'Imperfect': PLACEHOLDER_6, 'Future': PLACEHOLDER_6,
+        'Perfect': PLACEHOLDER_6, 'Pluperfect': PLACEHOLDER_6, 'Future Perfect': PLACEHOLDER_6,
+        'Future (Archaic -bō)': PLACEHOLDER_6,
+    },
+    'SUBJUNCTIVE PASSIVE': {
+        'Present': PLACEHOLDER_6, 'Imperfect': PLACEHOLDER_6,
+        'Perfect': PLACEHOLDER_6, 'Pluperfect': PLACEHOLDER_6,
+    },
+    'IMPERATIVES': {
+        'Pres Act': PLACEHOLDER_4, 'Pres Pass': PLACEHOLDER_4,
+        'Fut Act': PLACEHOLDER_4, 'Fut Pass': PLACEHOLDER_4
+    },
+    'NON-FINITE': copy.deepcopy(PARADIGM_TEMPLATE['NON-FINITE']) # Can reuse this part
+}
+
+def compile_template(template):
+    """
+    Returns a function that builds a fresh copy of `template`, a tree of dicts, lists and
+    strings, from a generated literal. Instantiating it runs a few BUILD_MAP / BUILD_LIST
+    instructions instead of copy.deepcopy's generic walk and memo bookkeeping. Unlike
+    deepcopy, lists shared inside the template come out as separate lists.
+    """
+    def check(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    raise TypeError(f"Template keys must be strings, not {key!r}")
+                check(value)
+        elif isinstance(node, list):
+            for value in node:
+                check(value)
+        elif not isinstance(node, str):
+            raise TypeError(f"Templates can only hold dicts, lists and strings, not {node!r}")
+
+    check(template)
+    namespace = {}
+    exec(f"def instantiate():\n    return {template!r}\n", namespace)
+    return namespace['instantiate']
+
+new_paradigm = compile_template(PARADIGM_TEMPLATE)
+TEMPLATE_SECTION_FACTORIES = {name: compile_template(section) for name, section in PARADIGM_TEMPLATE.items()}
+new_master_scaffold = compile_template(MASTER_TEMPLATE)
+
+ENDINGS_DATA = {
+    'person': {
+        'active': ['m', 's', 't', 'mus', 'tis', 'nt'],
+        'passive': ['r', ['ris', 're'], 'tur', 'mur', 'minī', 'ntur']
+    },
+    'perfect_ind': ['ī', 'istī', 'it', 'imus', 'istis', ['ērunt', 'ēre']],
+    'pluperfect_ind': ['eram', 'erās', 'erat', 'erāmus', 'erātis', 'erant'],
+    'future_perfect_ind': ['erō', 'eris', 'erit', 'erimus', 'eritis', 'erint'],
+    'perfect_subj': ['erim', 'erīs', 'erit', 'erīmus', 'erītis', 'erint'],
+    'pluperfect_subj': ['issem', 'issēs', 'isset', 'issēmus', 'issētis', 'issent'],
+    'future_perfect_2_ind': [['sō', 'sim'], 'sis', 'sit', 'simus', 'sitis', 'sint'],
+    'archaic_aorist_subj': ['sim', 'sīs', 'sit', 'sīmus', 'sītis', 'sint'],
+    'optative_active': ['m', 's', 't', 'mus', 'tis', 'nt'],
+    'sync_perfect_ind': ['ī', 'stī', 't', 'mus', 'stis', ['runt', 're']],
+    'sync_pluperfect_ind': ['ram', 'rās', 'rat', 'rāmus', 'rātis', 'rant'],
+    'sync_future_perfect_ind': ['rō', 'ris', 'rit', 'rimus', 'ritis', 'rint'],
+    'sync_perfect_subj': ['rim', 'rīs', 'rit', 'rīmus', 'rītis', 'rint'],
+    'sync_pluperfect_subj': ['ssem', 'ssēs', 'sset', 'ssēmus', 'ssētis', 'ssent'],
+    'sync_perfect_inf': 'sse'
+}
+
+MACRON_MAP = str.maketrans("āēīōūĀĒĪŌŪ", "aeiouAEIOU")
+
+DEMACRON_MAP = str.maketrans("āēīōūĀĒĪŌŪ", "aeiouAEIOU")
+
+def demacronize(word):
+    """Strips all macrons from a Latin word."""
+    return word.translate(DEMACRON_MAP)
+
+def macronize_stepwise(word):
+    """The vowel-shortening rules applied one after the other; macronize() is checked against it."""
+    word = re.sub(r'([āēīōūĀĒĪŌŪ])([aeiouyāēīōūAEIOUY])', lambda m: m.group(1).translate(MACRON_MAP) + m.group(2), word)
+    word = re.sub(r'([āēīōūĀĒĪŌŪ])([mrt])$', lambda m: m.group(1).translate(MACRON_MAP) + m.group(2), word)
+    word = re.sub(r'([āēīōūĀĒĪŌŪ])(nt|nd)', lambda m: m.group(1).translate(MACRON_MAP) + m.group(2), word)
+    return word
+
+# A long vowel is shortened before another vowel, before a final m, r or t, and before nt/nd.
+SHORTENED_VOWEL_RE = re.compile(r'[āēīōūĀĒĪŌŪ](?=[aeiouyāēīōūAEIOUY]|[mrt]$|n[td])')
+ADJACENT_LONG_VOWELS_RE = re.compile(r'[āēīōūĀĒĪŌŪ]{2}')
+SHORT_VOWELS = {vowel: vowel.translate(MACRON_MAP) for vowel in "āēīōūĀĒĪŌŪ"}
+MACRONIZE_MEMO_SIZE = 2**14  # words; a verb's paradigm and derived verbs make a few hundred
+
+def _shorten_vowel(match):
+    return SHORT_VOWELS[match.group()]
+
+@functools.lru_cache(maxsize=MACRONIZE_MEMO_SIZE)
+def macronize(word):
+    """
+    Applies the vowel-shortening rules to a generated form in a single scan. The first rule
+    consumes the vowel after the one it shortens, so in a pair of long vowels the second
+    escapes it; the rare words with such a pair ('abīīs') take macronize_stepwise instead.
+    Results are memoized, so forms regenerated for the same verb cost one lookup.
+    """
+    if ADJACENT_LONG_VOWELS_RE.search(word):
+        return macronize_stepwise(word)
+    return SHORTENED_VOWEL_RE.sub(_shorten_vowel, word)
+
+def macronize_alternatives(value):
+    """macronize() applied to each alternative of a packed form (a str or a tuple of them)."""
+    return macronize(value) if isinstance(value, str) else tuple(macronize(alt) for alt in value)
+
+class AdjectiveDecliner:
+
+    def __init__(self):
+        self.endings_1_2 = {
+            'm': {'Nom Sg': 'us', 'Gen Sg': 'ī', 'Dat Sg': 'ō', 'Acc Sg': 'um', 'Abl Sg': 'ō', 'Nom Pl': 'ī',
+                  'Gen Pl': 'ōrum', 'Dat Pl': 'īs', 'Acc Pl': 'ōs', 'Abl Pl': 'īs'},
+            'f': {'Nom Sg': 'a', 'Gen Sg': 'ae', 'Dat Sg': 'ae', 'Acc Sg': 'am', 'Abl Sg': 'ā', 'Nom Pl': 'ae',
+                  'Gen Pl': 'ārum', 'Dat Pl': 'īs', 'Acc Pl': 'ās', 'Abl Pl': 'īs'},
+            'n': {'Nom Sg': 'um', 'Gen Sg': 'ī', 'Dat Sg': 'ō', 'Acc Sg': 'um', 'Abl Sg': 'ō', 'Nom Pl': 'a',
+                  'Gen Pl': 'ōrum', 'Dat Pl': 'īs', 'Acc Pl': 'a', 'Abl Pl': 'īs'}
+        }
+        self.endings_3_pap = {
+            'Nom Sg': 'ns', 'Gen Sg': 'is', 'Dat Sg': 'ī', 'Acc Sg': 'em', 'Abl Sg': 'e',
+            'Nom Pl': 'ēs', 'Gen Pl': 'ium', 'Dat Pl': 'ibus', 'Acc Pl': 'ēs', 'Abl Pl': 'ibus'
+        }
+
+    def decline_1_2(self, stem, lemma_nom_sg):
+        paradigm = {}
+        for gender, endings in self.endings_1_2.items():
+            paradigm[gender.upper()] = {case: stem + end for case, end in endings.items()}
+            if gender == 'm': paradigm[gender.upper()]['Nom Sg'] = lemma_nom_sg
+        return paradigm
+
+    def decline_pap(self, nom_sg, gen_stem):
+        paradigm = {}
+        mf_forms = {case: gen_stem + end for case, end in self.endings_3_pap.items()}
+        mf_forms['Nom Sg'] = nom_sg
+        paradigm['M/F'] = mf_forms
+        n_forms = mf_forms.copy()
+        n_forms['Acc Sg'] = nom_sg
+        n_forms['Nom Pl'] = gen_stem + 'ia'
+        n_forms['Acc Pl'] = gen_stem + 'ia'
+        paradigm['N'] = n_forms
+        return paradigm
+
+# Bit flags packed into Verb._flags.
+DEPONENT = 1 << 0
+SEMI_DEPONENT = 1 << 1
+DEFECTIVE_PRESENT = 1 << 2
+HIGHLY_IRREGULAR = 1 << 3
+COMPOUND = 1 << 4
+INCHOATIVE = 1 << 5
+DESIDERATIVE = 1 << 6
+
+# Display order of the auxiliaries of each compound passive perfect tense, and the tenses
+# of 'sum' they are taken from.
+PASSIVE_PERFECT_AUXILIARIES = {
+    'Perfect Indicative': (('INDICATIVE ACTIVE', ('Present', 'Perfect')),
+                           ['sum', 'fuī', 'es', 'fuistī', 'est', 'fuit', 'sumus', 'fuimus',
+                            'estis', 'fuistis', 'sunt', 'fuērunt', 'fuēre']),
+    'Pluperfect Indicative': (('INDICATIVE ACTIVE', ('Imperfect', 'Pluperfect')),
+                              ['eram', 'fueram', 'erās', 'fuerās', 'erat', 'fuerat', 'erāmus',
+                               'fuerāmus', 'erātis', 'fuerātis', 'erant', 'fuerant']),
+    'Future Perfect Indicative': (('INDICATIVE ACTIVE', ('Future', 'Future Perfect')),
+                                  ['erō', 'fuerō', 'eris', 'fueris', 'erit', 'fuerit', 'erimus',
+                                   'fuerimus', 'eritis', 'fueritis', 'erunt', 'fuerint']),
+    'Perfect Subjunctive': (('SUBJUNCTIVE ACTIVE', ('Present', 'Perfect')),
+                            ['sim', 'siem', 'fuam', 'fuerim', 'sīs', 'siēs', 'fuās', 'fuerīs',
+                             'sit', 'siet', 'fuat', 'fuerit', 'sīmus', 'siēmus', 'fuāmus',
+                             'fuerīmus', 'sītis', 'siētis', 'fuātis', 'fuerītis', 'sint',
+                             'sient', 'fuant', 'fuerint']),
+    'Pluperfect Subjunctive': (('SUBJUNCTIVE ACTIVE', ('Imperfect', 'Pluperfect')),
+                               ['essem', 'fuissem', 'forem', 'essēs', 'fuissēs', 'forēs',
+                                'esset', 'fuisset', 'foret', 'essēmus', 'fuissēmus', 'forēmus',
+                                'essētis', 'fuissētis', 'forētis', 'essent', 'fuissent',
+                                'forent']),
+}
+
+# --- Present System Suffixes ---
+PRESENT_SYSTEM_CONJUGATIONS = (1, 2, 3, 3.5, 4)
+PRESENT_SUBJ_VOWELS = {1: 'ē', 2: 'eā', 3: 'ā', 3.5: 'iā', 4: 'iā'}
+PRESENT_THEME_VOWELS = {1: 'ā', 2: 'ē', 4: 'ī'}
+IMPERFECT_IND_VOWELS = {1: 'ā', 2: 'ē', 3: 'ē', 3.5: 'iē', 4: 'iē'}
+DEPONENT_INFINITIVE_THEMES = {1: 'āre', 2: 'ēre', 3: 'ere', 3.5: 'ere', 4: 'īre'}
+# A long vowel at the end of a stem, or before a final m, n, r or t, can be shortened by what follows it.
+LONG_VOWEL_TAIL_RE = re.compile(r'[āēīōūĀĒĪŌŪ][mnrt]?$')
+
+def present_system_suffixes(person_endings, conjugation, tense, mood, voice):
+    """
+    The six suffixes the present system of `conjugation` appends, before shortening, to the
+    present stem, or to the infinitive in the imperfect subjunctive. Alternatives are tuples.
+    The first person of the present indicative comes from p1 instead and is None here.
+    """
+    ends = person_endings[voice]
+
+    def suffix(vowel, end):
+        return vowel + end if isinstance(end, str) else tuple(vowel + alt for alt in end)
+
+    if tense == 'present' and mood == 'subj':
+        vowel = 'ea' if conjugation == 2 and voice == 'active' else PRESENT_SUBJ_VOWELS[conjugation]
+        suffixes = [suffix(vowel, end) for end in ends]
+    elif tense == 'present':
+        suffixes = [None]
+        for person, end in enumerate(ends[1:], 2):
+            if conjugation in PRESENT_THEME_VOWELS:
+                vowel = PRESENT_THEME_VOWELS[conjugation]
+            elif conjugation == 3.5 and not (voice == 'passive' and person == 2):
+                vowel = 'iu' if person == 6 else 'i'
+            else:
+                vowel = 'u' if person == 6 else 'e' if voice == 'passive' and person == 2 else 'i'
+            suffixes.append(suffix(vowel, end))
+    elif tense == 'imperfect' and mood == 'ind':
+        suffixes = [suffix(IMPERFECT_IND_VOWELS[conjugation] + 'bā', end) for end in ends]
+    elif tense == 'imperfect':
+        suffixes = [suffix('', end) for end in ends]
+    elif conjugation in (1, 2):
+        vowel = 'ā' if conjugation == 1 else 'ē'
+        suffixes = [vowel + ('bō' if voice == 'active' else 'bor'), suffix(vowel + 'be', ends[1])]
+        suffixes += [suffix(vowel + 'bi', end) for end in ends[2:5]] + [suffix(vowel + 'bu', ends[5])]
+    else:
+        vowel = 'i' if conjugation in (3.5, 4) else ''
+        suffixes = [suffix(vowel + 'a', ends[0])] + [suffix(vowel + 'ē', end) for end in ends[1:]]
+    return tuple(suffixes)
+
+class VerbContext:
+    """The endings, decliner and irregular paradigms shared by every Verb of one database."""
+    __slots__ = ('endings', 'decliner', 'irregular_paradigms', '_auxiliaries', '_suffixes')
+
+    def __init__(self, endings, decliner, irregular_paradigms):
+        self.endings = endings
+        self.decliner = decliner
+        self.irregular_paradigms = irregular_paradigms
+        self._auxiliaries = {}
+        self._suffixes = {}
+
+    def present_system_suffixes(self, conjugation, tense, mood, voice):
+        """
+        (suffixes, shortened): present_system_suffixes() for this database's endings, and the
+        same with macronize() already applied to each suffix on its own. Built once per
+        conjugation, tense, mood and voice.
+        """
+        key = (conjugation, tense, mood, voice)
+        table = self._suffixes.get(key)
+        if table is None:
+            suffixes = present_system_suffixes(self.endings['person'], conjugation, tense, mood, voice)
+            shortened = tuple(None if suffix is None else macronize_alternatives(suffix) for suffix in suffixes)
+            table = self._suffixes[key] = (suffixes, shortened)
+        return table
+
+    def passive_perfect_auxiliaries(self, tense_name):
+        """
+        For each of the six persons of a compound passive perfect tense, the tuple of 'sum'
+        forms that follow the participle, in display order. They are split out of the 'sum'
+        irregular paradigm on first use, which must therefore be complete by then (see
+        complete_sum_paradigm).
+        """
+        auxiliaries = self._auxiliaries.get(tense_name)
+        if auxiliaries is None:
+            (mood, sum_tenses), preferred_order = PASSIVE_PERFECT_AUXILIARIES[tense_name]
+            sum_mood_dict = self.irregular_paradigms.get('sum', {}).get(mood, {})
+            auxiliaries = []
+            for i in range(6):
+                helpers_raw = []
+                for tense in sum_tenses:
+                    sum_forms = sum_mood_dict.get(tense, [])
+                    if isinstance(sum_forms, list) and len(sum_forms) > i:
+                        helpers_raw.extend(sum_forms[i].split(' / '))
+                helpers = list(dict.fromkeys([h.strip() for h in helpers_raw if h and h != 'Ø']))
+                auxiliaries.append(tuple(sorted(
+                    helpers, key=lambda h: preferred_order.index(h) if h in preferred_order else 99)))
+            auxiliaries = self._auxiliaries[tense_name] = tuple(auxiliaries)
+        return auxiliaries
+
+class Verb:
+    # A lexicon-sized database keeps thousands of these alive, so a Verb is a slotted record:
+    # the raw principal parts and properties (shared with the lexicon entry), the derived
+    # conjugation and stems, and the boolean markers packed into one int. Everything else
+    # (p1-p4, is_*, irregularities, ...) is a read-only view computed from those slots.
+    __slots__ = ('lemma', 'principal_parts', 'conjugation_num', 'properties', '_context', '_flags',
+                 'base_verb_lemma', 'true_prefix', 'conjugation', 'present_stem', 'perfect_stem',
+                 'supine_stem')
+
+    def __init__(self, verb_data, endings, decliner, irregular_paradigms, context=None):
+        self.lemma = verb_data.get('lemma', '')
+        self.principal_parts = verb_data.get('principal_parts', ['', '', ''])
+        self.conjugation_num = verb_data.get('conjugation', '')
+        self.properties = verb_data.get('properties', {})
+        self._context = context or VerbContext(endings, decliner, irregular_paradigms)
+        while len(self.principal_parts) < 3: self.principal_parts.append('')
+        flags = 0
+        semantic_props = self.properties.get('semantic', [])
+        if 'deponent' in semantic_props: flags |= DEPONENT
+        if 'semi_deponent' in semantic_props: flags |= SEMI_DEPONENT
+        domain_props = self.properties.get('domain', [])
+        if 'defective_present' in domain_props: flags |= DEFECTIVE_PRESENT
+        general_props = self.properties.get('general', [])
+        if 'highly_irregular' in general_props: flags |= HIGHLY_IRREGULAR
+        derivation_props = self.properties.get('derivation', [])
+        if any(p.startswith('compound') for p in derivation_props): flags |= COMPOUND
+        if 'inchoative' in derivation_props: flags |= INCHOATIVE
+        if 'desiderative' in derivation_props: flags |= DESIDERATIVE
+        self._flags = flags
+        self.base_verb_lemma = ""
+        self.true_prefix = ""
+        if self.is_compound:
+            for tag in derivation_props:
+                if tag.startswith('compound'):
+                    match = re.search(r'compound\((.*?)\)', tag)
+                    if match:
+                        content = match.group(1)
+                        # --- THIS IS THE DEFINITIVE FIX ---
+                        if '+' in content:
+                            parts = content.split('+')
+                            self.true_prefix = parts[0]
+                            self.base_verb_lemma = parts[1]
+                        else:
+                            # Handle malformed tags like compound(sum) gracefully
+                            self.true_prefix = ""  # No prefix
+                            self.base_verb_lemma = content  # The content is the base
+                        break  # Found the compound tag, stop looking
+
+        self.conjugation = self._get_conjugation()
+        self.present_stem = self._get_present_stem()
+        self.perfect_stem = self._get_perfect_stem()
+        self.supine_stem = self._get_supine_stem()
+
+    # --- Read-only views over the slots ---
+    p1 = property(lambda self: self.lemma)
+    p2 = property(lambda self: self.principal_parts[0])
+    p3 = property(lambda self: self.principal_parts[1])
+    p4 = property(lambda self: self.principal_parts[2])
+    endings = property(lambda self: self._context.endings)
+    decliner = property(lambda self: self._context.decliner)
+    irregular_paradigms = property(lambda self: self._context.irregular_paradigms)
+    is_deponent = property(lambda self: bool(self._flags & DEPONENT))
+    is_semi_deponent = property(lambda self: bool(self._flags & SEMI_DEPONENT))
+    is_defective_present = property(lambda self: bool(self._flags & DEFECTIVE_PRESENT))
+    is_highly_irregular = property(lambda self: bool(self._flags & HIGHLY_IRREGULAR))
+    is_compound = property(lambda self: bool(self._flags & COMPOUND))
+    is_inchoative = property(lambda self: bool(self._flags & INCHOATIVE))
+    is_desiderative = property(lambda self: bool(self._flags & DESIDERATIVE))
+
+    @property
+    def supine_abl(self):
+        return self.supine_stem + 'ū' if self.supine_stem else ''
+
+    @property
+    def irregularities(self):
+        return {tag for tags in self.properties.values() for tag in tags}
+
+    @property
+    def suppletive_stems(self):
+        suppletive_stems = {}
+        for tag in self.properties.get('general', []):
+            if tag.startswith('suppletive('):
+                match = re.search(r'suppletive\((.*?)\)', tag)
+                if match:
+                    stems = match.group(1).split(',');
+                    if len(stems) >= 3:
+                        suppletive_stems['present'] = stems[0]
+                        suppletive_stems['perfect'] = stems[1]
+                        suppletive_stems['supine'] = stems[2]
+                break
+        return suppletive_stems
+
+    # Per-verb state stored in lexicon snapshots: every slot except the shared context,
+    # which from_record() re-attaches.
+    RECORD_FIELDS = tuple(name for name in __slots__ if name != '_context')
+
+    def to_record(self):
+        return tuple(getattr(self, name) for name in self.RECORD_FIELDS)
+
+    @classmethod
+    def from_record(cls, record, context):
+        """Rebuilds a Verb from to_record() output without re-running the tag parsing and stem rules."""
+        verb = cls.__new__(cls)
+        for name, value in zip(cls.RECORD_FIELDS, record):
+            setattr(verb, name, value)
+        verb._context = context
+        return verb
+
+    def __repr__(self):
+        conj_repr = str(self.conjugation) if self.conjugation != 3.5 else "3-iō"
+        type_str = "Deponent" if self.is_deponent else "Semi-Deponent" if self.is_semi_deponent else "Active"
+        base_repr = f"Verb: {self.p1} | Conj: {conj_repr} ({type_str}) | Stems: P='{self.present_stem}', Perf='{self.perfect_stem}', Sup='{self.supine_stem}'"
+        prop_str_parts = []
+        display_order = ['derivation', 'semantic', 'present', 'perfect', 'supine', 'general', 'archaic', 'domain']
+        for category in display_order:
+            tags = self.properties.get(category)
+            if tags:
+                prop_str_parts.append(f"{', '.join(tags)}")
+        if prop_str_parts:
+            return f"{base_repr}\nMarkers: {' | '.join(prop_str_parts)}"
+        else:
+            return base_repr
+
+    def _combine(self, stem, endings_list):
+        return [stem + end if isinstance(end, str) else pack_alternatives([stem + alt for alt in end])
+                for end in endings_list]
+
+    def _get_conjugation(self):
+        is_io_verb = self.p1.endswith('iō') or (self.is_deponent and self.p1.endswith('ior'))
+        if is_io_verb and self.conjugation_num == 3:
+            return 3.5
+        try:
+            return int(self.conjugation_num)
+        except (ValueError, TypeError):
+            if self.p2.endswith('āre') or self.p2.endswith('ārī'): return 1
+            if self.p2.endswith('ēre') or self.p2.endswith('ērī'): return 2
+            if self.p2.endswith('ere') or self.p2.endswith('ī'): return 3
+            if self.p2.endswith('īre') or self.p2.endswith('īrī'): return 4
+            return self.conjugation_num
+
+    def _get_present_stem(self):
+        infinitive = self.p2
+        if not infinitive: return ""
+        irregular_infinitives = {'ferre': 'fer', 'esse': 'es', 'posse': 'pos', 'velle': 'vel', 'nōlle': 'nōl',
+                                 'mālle': 'māl', 'īre': 'ī', 'fierī': 'fī'}
+        if self.is_compound:
+            for base_inf, base_stem in irregular_infinitives.items():
+                if infinitive.endswith(base_inf):
+                    prefix_len = len(infinitive) - len(base_inf)
+                    prefix = infinitive[:prefix_len]
+                    return prefix + base_stem
+        if infinitive in irregular_infinitives:
+            return irregular_infinitives[infinitive]
+        if self.is_deponent:
+            if infinitive.endswith('rī'):
+                return infinitive[:-3]
+            elif infinitive.endswith('ī'):
+                return infinitive[:-1]
+        elif infinitive.endswith('re'):
+            return infinitive[:-3]
+        return ""
+
+    def _get_perfect_stem(self):
+        p3 = self.p3.partition(' / ')[0]
+        if not p3: return ""
+        if (self.is_deponent or self.is_semi_deponent):
+            return p3.split(' ')[0][:-2]
+        elif p3.endswith('ī'):
+            return p3[:-1]
+        return ""
+
+    def _get_supine_stem(self):
+        p4 = self.p4.partition(' / ')[0]
+        if not p4: return ""
+        if p4.endswith('um'):
+            return p4[:-2]
+        return ""
+
+    def generate_paradigm(self):
+        p = new_paradigm()
+
+        # --- START OF THE DEFINITIVE FIX ---
+
+        # We only check for 'defective_present'. We REMOVE the check for 'irregular_present'.
+        # This ensures that ALL regular parts of an irregular verb (like fero's Present Subjunctive)
+        # are always generated. The merge in main() will overwrite the truly irregular parts.
+        if 'defective_present' not in self.irregularities:
+            # Active Present System
+            p['INDICATIVE ACTIVE']['Present'] = self._conjugate_present('ind', 'active')
+            p['SUBJUNCTIVE ACTIVE']['Present'] = self._conjugate_present('subj', 'active')
+            p['INDICATIVE ACTIVE']['Imperfect'] = self._conjugate_imperfect('ind', 'active')
+            p['INDICATIVE ACTIVE']['Future'] = self._conjugate_future('ind', 'active')
+            p['SUBJUNCTIVE ACTIVE']['Imperfect'] = self._conjugate_imperfect('subj', 'active')
+
+            # Passive Present System (if applicable)
+            if self.p1 != 'sum' and not self.is_semi_deponent:
+                p['INDICATIVE PASSIVE']['Present'] = self._conjugate_present('ind', 'passive')
+                p['SUBJUNCTIVE PASSIVE']['Present'] = self._conjugate_present('subj', 'passive')
+                p['INDICATIVE PASSIVE']['Imperfect'] = self._conjugate_imperfect('ind', 'passive')
+                p['INDICATIVE PASSIVE']['Future'] = self._conjugate_future('ind', 'passive')
+                p['SUBJUNCTIVE PASSIVE']['Imperfect'] = self._conjugate_imperfect('subj', 'passive')
+
+        # --- END OF THE DEFINITIVE FIX ---
+
+        # --- PERFECT SYSTEM (ACTIVE & PASSIVE) ---
+        if self.perfect_stem:
+            p['INDICATIVE ACTIVE']['Perfect'] = self._combine(self.perfect_stem, self.endings['perfect_ind'])
+            p['INDICATIVE ACTIVE']['Pluperfect'] = self._combine(self.perfect_stem, self.endings['pluperfect_ind'])
+            p['INDICATIVE ACTIVE']['Future Perfect'] = self._combine(self.perfect_stem,
+                                                                     self.endings['future_perfect_ind'])
+            p['SUBJUNCTIVE ACTIVE']['Perfect'] = self._combine(self.perfect_stem, self.endings['perfect_subj'])
+            p['SUBJUNCTIVE ACTIVE']['Pluperfect'] = self._combine(self.perfect_stem,
+                                                                  self.endings['pluperfect_subj'])
+
+        if self.p1 != 'sum' and self.supine_stem:
+            ppp_sg, ppp_pl = f"{self.supine_stem}us", f"{self.supine_stem}ī"
+
+            def build_passive_perfect(tense_name):
+                forms = []
+                for i, helpers in enumerate(self._context.passive_perfect_auxiliaries(tense_name)):
+                    participle = ppp_sg if i < 3 else ppp_pl
+                    if helpers:
+                        forms.append(pack_alternatives((f"{participle} {helpers[0]}",) + helpers[1:]))
+                    else:
+                        forms.append(PLACEHOLDER_STR)
+                return forms
+
+            p['INDICATIVE PASSIVE']['Perfect'] = build_passive_perfect('Perfect Indicative')
+            p['INDICATIVE PASSIVE']['Pluperfect'] = build_passive_perfect('Pluperfect Indicative')
+            p['INDICATIVE PASSIVE']['Future Perfect'] = build_passive_perfect('Future Perfect Indicative')
+            p['SUBJUNCTIVE PASSIVE']['Perfect'] = build_passive_perfect('Perfect Subjunctive')
+            p['SUBJUNCTIVE PASSIVE']['Pluperfect'] = build_passive_perfect('Pluperfect Subjunctive')
+
+        # --- VOICE-RELATED SWAPPING (DEPONENT / SEMI-DEPONENT) ---
+        if self.is_deponent:
+            p['INDICATIVE ACTIVE'] = p.pop('INDICATIVE PASSIVE')
+            p['SUBJUNCTIVE ACTIVE'] = p.pop('SUBJUNCTIVE PASSIVE')
+            p['IMPERATIVES']['Pres Act'] = p['IMPERATIVES'].pop('Pres Pass', PLACEHOLDER_4)
+            p['IMPERATIVES']['Fut Act'] = p['IMPERATIVES'].pop('Fut Pass', PLACEHOLDER_4)
+            inf_map = p['NON-FINITE']['INFINITIVES']
+            inf_map['Pres Act'] = inf_map.pop('Pres Pass', PLACEHOLDER_STR)
+            inf_map['Perf Act'] = inf_map.pop('Perf Pass', PLACEHOLDER_STR)
+            inf_map['Fut Act'] = inf_map.pop('Fut Pass', PLACEHOLDER_STR)
+            p['INDICATIVE PASSIVE'] = TEMPLATE_SECTION_FACTORIES['INDICATIVE PASSIVE']()
+            p['SUBJUNCTIVE PASSIVE'] = TEMPLATE_SECTION_FACTORIES['SUBJUNCTIVE PASSIVE']()
+        elif self.is_semi_deponent:
+            p['INDICATIVE ACTIVE']['Perfect'] = p['INDICATIVE PASSIVE']['Perfect']
+            p['INDICATIVE ACTIVE']['Pluperfect'] = p['INDICATIVE PASSIVE']['Pluperfect']
+            p['INDICATIVE ACTIVE']['Future Perfect'] = p['INDICATIVE PASSIVE']['Future Perfect']
+            p['SUBJUNCTIVE ACTIVE']['Perfect'] = p['SUBJUNCTIVE PASSIVE']['Perfect']
+            p['SUBJUNCTIVE ACTIVE']['Pluperfect'] = p['SUBJUNCTIVE PASSIVE']['Pluperfect']
+            p['NON-FINITE']['INFINITIVES']['Perf Act'] = p['NON-FINITE']['INFINITIVES']['Perf Pass']
+            p['INDICATIVE PASSIVE'] = TEMPLATE_SECTION_FACTORIES['INDICATIVE PASSIVE']()
+            p['SUBJUNCTIVE PASSIVE'] = TEMPLATE_SECTION_FACTORIES['SUBJUNCTIVE PASSIVE']()
+
+        # --- SYNCOPATION MERGING ---
+        if self.perfect_stem:
+            sync_forms = self._generate_syncopated_perfects()
+            if sync_forms:
+                target_indicative = p.get('INDICATIVE ACTIVE', {})
+                target_subjunctive = p.get('SUBJUNCTIVE ACTIVE', {})
+
+                def merge_sync(target_dict, tense, sync_key):
+                    if tense in target_dict and sync_key in sync_forms and sync_forms[sync_key]:
+                        full_forms = target_dict[tense]
+                        syncopated = sync_forms[sync_key]
+                        merged_list = []
+                        for full, sync in zip(full_forms, syncopated):
+                            if not sync or sync == 'Ø':
+                                merged_list.append(full)
+                            else:
+                                merged_list.append(alternatives(full) + alternatives(sync))
+                        target_dict[tense] = merged_list
+
+                merge_sync(target_indicative, 'Perfect', 'Perfect')
+                merge_sync(target_indicative, 'Pluperfect', 'Pluperfect')
+                merge_sync(target_indicative, 'Future Perfect', 'Future Perfect')
+                merge_sync(target_subjunctive, 'Perfect', 'Perfect Subjunctive')
+                merge_sync(target_subjunctive, 'Pluperfect', 'Pluperfect Subjunctive')
+
+        # --- NON-FINITE AND IMPERATIVES ---
+        p['IMPERATIVES'] = self._generate_imperatives()
+        p['NON-FINITE'] = self._generate_non_finite()
+
+        # --- FINAL CLEANUP FOR DEPONENTS ---
+        if self.is_deponent:
+            if 'Present' in p['IMPERATIVES']: p['IMPERATIVES']['Pres Act'] = p['IMPERATIVES'].pop('Present')
+            if 'Future' in p['IMPERATIVES']: p['IMPERATIVES']['Fut Act'] = p['IMPERATIVES'].pop('Future')
+            if 'INFINITIVES' in p['NON-FINITE']:
+                inf_map = p['NON-FINITE']['INFINITIVES']
+                if 'Present' in inf_map: inf_map['Pres Act'] = inf_map.pop('Present')
+                if 'Perfect' in inf_map: inf_map['Perf Act'] = inf_map.pop('Perfect')
+                if 'Future' in inf_map: inf_map['Fut Act'] = inf_map.pop('Future')
+        return p
+
+    def _conjugate_present(self, mood, voice):
+        if self.conjugation not in [1, 2, 3, 3.5, 4]: return PLACEHOLDER_6
+        forms = self._attach_present_suffixes(self.present_stem, 'present', mood, voice)
+        if mood == 'ind':
+            forms[0] = macronize(self.p1 if voice == 'active' else
+                                 (self.p1[:-1] + 'or' if self.p1.endswith('ō') else self.p1))
+        return forms
+
+    def _conjugate_imperfect(self, mood, voice):
+        if self.conjugation not in [1, 2, 3, 3.5, 4]: return PLACEHOLDER_6
+        if mood == 'ind':
+            return self._attach_present_suffixes(self.present_stem, 'imperfect', mood, voice)
+        infinitive = self.p2
+        if self.is_deponent:
+            infinitive = self.present_stem + DEPONENT_INFINITIVE_THEMES[self.conjugation]
+        return self._attach_present_suffixes(infinitive, 'imperfect', mood, voice)
+
+    def _conjugate_future(self, mood, voice):
+        if self.conjugation not in [1, 2, 3, 3.5, 4]: return PLACEHOLDER_6
+        if mood == 'subj': return []
+        return self._attach_present_suffixes(self.present_stem, 'future', mood, voice)
+
+    def _attach_present_suffixes(self, base, tense, mood, voice):
+        """
+        The six forms of a present-system tense: `base` followed by each of the precompiled
+        suffixes, shortened. Shortening only looks ahead, so unless the base ends in a long
+        vowel, or in one before m, n, r or t, the macronized base plus the already shortened
+        suffix is the macronized word.
+        """
+        suffixes, shortened = self._context.present_system_suffixes(self.conjugation, tense, mood, voice)
+        if LONG_VOWEL_TAIL_RE.search(base):
+            return [None if suffix is None else
+                    macronize(base + suffix) if suffix.__class__ is str else tuple(macronize(base + alt) for alt in suffix)
+                    for suffix in suffixes]
+        base = macronize(base)
+        return [None if suffix is None else
+                base + suffix if suffix.__class__ is str else tuple(base + alt for alt in suffix)
+                for suffix in shortened]
+
+    def _generate_imperatives(self):
+        if self.conjugation not in [1, 2, 3, 3.5, 4]:
+            return {'Pres Act': ['Ø'] * 4, 'Pres Pass': ['Ø'] * 4, 'Fut Act': ['Ø'] * 4, 'Fut Pass': ['Ø'] * 4}
+        imperatives = {}
+        irregulars = {'dīcō': 'dīc', 'dūcō': 'dūc', 'faciō': 'fac', 'ferō': 'fer'}
+
+        # --- PRESENT IMPERATIVES ---
+        if self.is_deponent:
+            sg_ending = {'1': 'āre', '2': 'ēre', '3': 'ere', '3.5': 'ere', '4': 'īre'}.get(str(self.conjugation))
+            deponent_sg = self.present_stem + (sg_ending or '')
+            pl_ending = {'1': 'āminī', '2': 'ēminī', '3': 'iminī', '3.5': 'iminī', '4': 'īminī'}.get(
+                str(self.conjugation))
+            deponent_pl = self.present_stem + (pl_ending or '')
+            # FIX: Use the correct final key 'Pres Act'
+            imperatives['Pres Act'] = [macronize(deponent_sg), 'Ø', macronize(deponent_pl), 'Ø']
+        else:  # Handles both Active and Semi-Deponent
+            sg = irregulars.get(self.p1, self.p2[:-2] if self.conjugation in [1, 2, 4] else self.present_stem + 'e')
+            pl = sg + 'te'
+            imperatives['Pres Act'] = [macronize(sg), 'Ø', macronize(pl), 'Ø']
+
+            # Passive forms are only for non-semi-deponents
+            if not self.is_semi_deponent:
+                if self.p1 == 'faciō':
+                    passive_present_forms = ['fī', 'Ø', 'fīte', 'Ø']
+                else:
+                    pres_pass_pl_ending = {'1': 'āminī', '2': 'ēminī', '3': 'iminī', '3.5': 'iminī', '4': 'īminī'}.get(
+                        str(self.conjugation))
+                    pres_pass_pl = self.present_stem + (pres_pass_pl_ending or '')
+                    passive_present_forms = [macronize(self.p2), 'Ø', macronize(pres_pass_pl), 'Ø']
+                imperatives['Pres Pass'] = passive_present_forms
+
+        if not self.present_stem: return imperatives
+
+        # --- FUTURE IMPERATIVES ---
+        vowel = {'1': 'ā', '2': 'ē', '3': 'i', '3.5': 'i', '4': 'ī'}.get(str(self.conjugation))
+        future_pl_vowel = {'1': 'ā', '2': 'ē', '3': 'u', '3.5': 'iu', '4': 'iu'}.get(str(self.conjugation))
+        if self.is_deponent:
+            future_sg = self.present_stem + (vowel or '') + 'tor'
+            future_pl = self.present_stem + (future_pl_vowel or '') + 'ntor'
+            # FIX: Use the correct final key 'Fut Act'
+            imperatives['Fut Act'] = [macronize(future_sg), macronize(future_sg), 'Ø', macronize(future_pl)]
+        else:  # Handles both Active and Semi-Deponent
+            future_act_sg = self.present_stem + (vowel or '') + 'tō'
+            future_act_2p = self.present_stem + (vowel or '') + 'tōte'
+            future_act_3p = self.present_stem + (future_pl_vowel or '') + 'ntō'
+            imperatives['Fut Act'] = [macronize(future_act_sg), macronize(future_act_sg), macronize(future_act_2p),
+                                      macronize(future_act_3p)]
+
+            # Passive forms are only for non-semi-deponents
+            if not self.is_semi_deponent:
+                if self.p1 == 'faciō':
+                    imperatives['Fut Pass'] = ['fītō', 'fītō', 'Ø', 'fīuntō']
+                else:
+                    future_pass_sg = self.present_stem + (vowel or '') + 'tor'
+                    future_pass_3p = self.present_stem + (future_pl_vowel or '') + 'ntor'
+                    imperatives['Fut Pass'] = [macronize(future_pass_sg), macronize(future_pass_sg), 'Ø',
+                                               macronize(future_pass_3p)]
+        return imperatives
+
+    def _generate_non_finite(self):
+        parts = TEMPLATE_SECTION_FACTORIES['NON-FINITE']()
+        participles_full = {}
+        if self.p1 != 'sum':
+            vowel_pap = {'1': 'ā', '2': 'ē', '3': 'ē', '3.5': 'iē', '4': 'iē'}.get(str(self.conjugation))
+            if vowel_pap and self.present_stem:
+                pap_nom = f"{self.present_stem}{vowel_pap}ns";
+                short_vowel_pap = vowel_pap.translate(MACRON_MAP)
+                pap_gen_stem = f"{self.present_stem}{short_vowel_pap}nt"
+                participles_full['PAP'] = self.decliner.decline_pap(pap_nom, pap_gen_stem)
+        if self.supine_stem:
+            if self.p1 != 'sum':
+                ppp_nom = f"{self.supine_stem}us"
+                participles_full['PPP'] = self.decliner.decline_1_2(self.supine_stem, ppp_nom)
+            fap_decline_stem = self.supine_stem if self.supine_stem.endswith('ūr') else self.supine_stem + 'ūr'
+            fap_nom = f"{fap_decline_stem}us"
+            participles_full['FAP'] = self.decliner.decline_1_2(fap_decline_stem, fap_nom)
+        if self.p1 != 'sum':
+            vowel_fpp = {'1': 'a', '2': 'e', '3': 'e', '3.5': 'ie', '4': 'ie'}.get(str(self.conjugation))
+            if vowel_fpp and self.present_stem:
+                fpp_stem = f"{self.present_stem}{vowel_fpp}nd"
+                participles_full['FPP (Gerundive)'] = self.decliner.decline_1_2(fpp_stem, f"{fpp_stem}us")
+                parts['GERUND'] = {'Gen': f"{fpp_stem}ī", 'Dat': f"{fpp_stem}ō", 'Acc': f"{fpp_stem}um",
+                                   'Abl': f"{fpp_stem}ō"}
+                if self.conjugation in [3.5, 4]:
+                    fpp_stem_undus = f"{self.present_stem}und"
+                    participles_full['FPP (Gerundive -undus form)'] = self.decliner.decline_1_2(fpp_stem_undus,
+                                                                                                f"{fpp_stem_undus}us")
+                    parts['GERUND (-undus form)'] = {'Gen': f"{fpp_stem_undus}ī", 'Dat': f"{fpp_stem_undus}ō",
+                                                     'Acc': f"{fpp_stem_undus}um", 'Abl': f"{fpp_stem_undus}ō"}
+        parts['PARTICIPLES'] = participles_full
+        fore_alt = 'fore';
+        inf = parts['INFINITIVES']
+
+        # --- START OF RESTRUCTURED INFINITIVE LOGIC ---
+
+        # 1. Present Infinitives
+        if self.is_deponent:
+            inf['Pres Act'] = self.p2
+        else:  # Active and Semi-Deponent have an active present infinitive
+            if self.p2:
+                inf['Pres Act'] = self.p2
+            # Only true active verbs have a present passive infinitive
+            if not self.is_semi_deponent and self.p1 != 'sum':
+                if self.present_stem and self.p2:
+                    classical_pres_pass_inf = f"{self.present_stem}ī" if self.conjugation in [3,
+                                                                                              3.5] else f"{self.p2[:-1]}ī"
+                    if self.conjugation in [1, 3]:
+                        poetic_inf = f"{self.p2[:-1]}ier" if self.conjugation == 1 else f"{self.present_stem}ier"
+                        classical_pres_pass_inf = (classical_pres_pass_inf, poetic_inf)
+                    inf['Pres Pass'] = classical_pres_pass_inf
+
+        # 2. Perfect Infinitives
+        if self.perfect_stem:
+            if self.is_deponent or self.is_semi_deponent:
+                ppp_lemma = f"{self.supine_stem}us, -a, -um"
+                inf['Perf Act'] = (f"{ppp_lemma} esse", fore_alt)
+            else:  # True Active
+                perf_act_inf = f"{self.perfect_stem}isse"
+                if 'v_perfect' in self.properties.get('perfect', []):
+                    sync_inf = self._generate_syncopated_perfects().get('Perfect Infinitive', '')
+                    if sync_inf: perf_act_inf = (perf_act_inf, sync_inf)
+                inf['Perf Act'] = perf_act_inf
+
+        if self.supine_stem and not self.is_deponent and not self.is_semi_deponent:
+            ppp_lemma = f"{self.supine_stem}us, -a, -um"
+            inf['Perf Pass'] = (f"{ppp_lemma} esse", fore_alt)
+
+        # 3. Future Infinitives
+        if self.supine_stem:
+            fap_decline_stem = self.supine_stem if self.supine_stem.endswith('ūr') else self.supine_stem + 'ūr'
+            fap_lemma = f"{fap_decline_stem}us, -a, -um"
+            inf['Fut Act'] = (f"{fap_lemma} esse", fore_alt)
+            if not self.is_deponent and not self.is_semi_deponent and self.p4:
+                inf['Fut Pass'] = f"{self.p4} īrī"
+
+        # --- END OF RESTRUCTURED LOGIC ---
+
+        if self.p1 != 'sum' and self.p4:
+            parts['SUPINE']['Acc'] = self.p4
+            parts['SUPINE']['Abl'] = self.supine_abl
+        return parts
+
+    def _get_true_root(self):
+        stem = self.present_stem
+        if 'no_infix_perfect' in self.properties.get('perfect', []) and ('n' in stem[:-1] or 'm' in stem[:-1]):
+            last_nasal_pos = max(stem.rfind('n', 0, -1), stem.rfind('m', 0, -1))
+            if last_nasal_pos != -1:
+                proposed_root = stem[:last_nasal_pos] + stem[last_nasal_pos + 1:]
+                vowel_pos = last_nasal_pos - 1
+                if vowel_pos >= 0 and proposed_root[vowel_pos] in "aeiou":
+                    vowel = proposed_root[vowel_pos]
+                    macronized_vowel = {'a': 'ā', 'e': 'ē', 'i': 'ī', 'o': 'ō', 'u': 'ū'}.get(vowel, vowel)
+                    proposed_root = proposed_root[:vowel_pos] + macronized_vowel + proposed_root[vowel_pos + 1:]
+                return proposed_root
+        return stem
+
+    def _get_archaic_sigmatic_stems(self):
+        """
+        Internal helper method to generate all possible archaic sigmatic stems.
+        This is the single source of truth for both the archaic future and aorist subjunctive.
+        """
+        check_lemma = self.base_verb_lemma if self.is_compound else self.p1
+
+        # Handle `quaerō` and its compounds with apophony separately.
+        if check_lemma == 'quaerō':
+            # Simple `quaerō` uses 'quaess'
+            if not self.is_compound:
+                return ['quaess']
+            # Compounds like `inquīrō` get `ss` added to the present stem root.
+            # This is the FIX: 'inquīr' -> 'inquīss'.
+            else:
+                return [self.present_stem[:-1] + 'ss']
+
+        special_archaic_stems = {'faciō': ['fax'], 'dīcō': ['dīx'], 'dūcō': ['dūx']}
+        if check_lemma in special_archaic_stems:
+            prefix = self.true_prefix if self.is_compound else ""
+            return [prefix + s for s in special_archaic_stems[check_lemma]]
+
+        final_stems = []
+        root = self._get_true_root()
+
+        if self.conjugation in [1, 2, 4]:
+            theme_vowel = {'1': 'ā', '2': 'ē', '4': 'ī'}.get(str(self.conjugation))
+            final_stems.append(self.present_stem + (theme_vowel or '') + 'ss')
+        elif self.conjugation in [3, 3.5]:
+            if root.endswith(('rr', 'll')):
+                final_stems.append(root[:-1] + 's')
+            elif root.endswith('qu'):
+                final_stems.extend([root, root[:-2] + 'x'])
+            elif root.endswith('r'):
+                final_stems.extend([root[:-1] + 'rr', root[:-1] + 'ss'])
+            elif root.endswith('mn'):
+                final_stems.append(root[:-1] + 'ps')
+            elif root.endswith('m'):
+                final_stems.append(root + 'ps')
+            elif root.endswith('b'):
+                final_stems.append(root[:-1] + 'ps')
+            elif root.endswith('tt'):
+                final_stems.append(root[:-2] + 'ss')
+            elif root.endswith(('lv', 'rv')):
+                final_stems.append(root[:-1] + 's')
+            elif root.endswith('x'):
+                final_stems.append(root)
+            elif root.endswith(('rt', 'lt')):
+                final_stems.append(root[:-1] + 's')
+            elif root.endswith(('g', 'c', 'h')):
+                final_stems.append(root[:-1] + 'x')
+            elif root.endswith(('d', 't')):
+                final_stems.append(root[:-1] + 'ss')
+            else:
+                final_stems.append(root + 's')
+
+        return sorted(list(set(final_stems)))
+
+    def _generate_archaic_future(self):
+        if self.is_inchoative or self.is_desiderative or self.p1 == 'eō' or not self.present_stem: return []
+
+        stems = self._get_archaic_sigmatic_stems()
+        if not stems: return []
+
+        archaic_endings = [['ō', 'im'], 'is', 'it', 'imus', 'itis', 'int']
+        forms = []
+        for end in archaic_endings:
+            forms.append(pack_alternatives([form for stem in stems
+                                            for form in alternatives(self._combine(stem, [end])[0])]))
+        return forms
+
+    def _generate_aorist_subjunctive(self):
+        if self.is_inchoative or self.is_desiderative or self.p1 == 'eō' or not self.present_stem: return []
+
+        stems = self._get_archaic_sigmatic_stems()
+        if not stems: return []
+
+        aorist_endings = self.endings['archaic_aorist_subj']
+        aorist_paradigm = []
+
+        for end in aorist_endings:
+            alt_forms = []
+            for stem in stems:
+                if stem.endswith(('s', 'x')):
+                    alt_forms.append(stem + end[1:])
+                else:
+                    base_form = stem + end
+                    # THE DEFINITIVE FIX: This regex now correctly captures short or long 'i'
+                    # and applies the phonological rule to both, fixing linquo and fero.
+                    corrected_form = re.sub(r'([rumnqu])s([iī])', r'\1\2', base_form)
+                    alt_forms.append(corrected_form)
+            aorist_paradigm.append(pack_alternatives(alt_forms))
+
+        return aorist_paradigm
+
+    def _generate_archaic_optative(self):
+        if self.is_inchoative or not self.present_stem: return []
+        ends = self.endings['optative_active']
+        optative_stem = ""
+
+        # --- START OF FINAL FIX ---
+
+        # For 'eō', the correct theoretical stem is 'eī-' (from the e- stem + ī optative marker).
+        # This replaces the previous, less accurate 'ī-' stem.
+        special_optative_stems = {
+            'sum': 'sī', 'possum': 'possī', 'volō': 'velī', 'nōlō': 'nōlī', 'mālō': 'mālī',
+            'dō': 'duī', 'edō': 'edī', 'for': 'ferē', 'eō': 'eī'
+        }
+
+        # --- END OF FINAL FIX ---
+
+        if self.p1 in special_optative_stems:
+            optative_stem = special_optative_stems[self.p1]
+        else:
+            if self.conjugation == 1:
+                optative_stem = self.present_stem + 'ē'
+            elif self.conjugation == 2:
+                optative_stem = self.present_stem + 'eī'
+            else:
+                return []
+
+        if optative_stem: return [macronize_alternatives(f) for f in self._combine(optative_stem, ends)]
+        return []
+
+    def _generate_archaic_bo_future(self, voice):
+        if not isinstance(self.conjugation, (int, float)):
+            return []
+        if self.conjugation < 3: return []
+        if self.p1 == 'eō':
+            return []
+        active_ends = ['bō', 'bis', 'bit', 'bimus', 'bitis', 'bunt']
+        passive_ends = ['bor', 'beris', 'bitur', 'bimur', 'biminī', 'buntur']
+        ends = active_ends if voice == 'active' else passive_ends
+        theme_vowel = {'3': 'ē', '4': 'ī', '3.5': 'iē'}.get(str(self.conjugation))
+        base = self.present_stem + (theme_vowel or '')
+        forms = [base + end for end in ends]
+        if voice == 'passive': forms[1] = (f"{base}beris", f"{base}bere")
+        return [macronize_alternatives(f) for f in forms]
+
+    def _generate_syncopated_perfects(self):
+        if not self.perfect_stem or not ('v_perfect' in self.properties.get('perfect', [])): return {}
+        sync_paradigm = {}
+        sync_stem = self.perfect_stem[:-1]
+        tenses_to_process = {
+            'Perfect': self.endings['sync_perfect_ind'],
+            'Pluperfect': self.endings['sync_pluperfect_ind'],
+            'Future Perfect': self.endings['sync_future_perfect_ind'],
+            'Perfect Subjunctive': self.endings['sync_perfect_subj'],
+            'Pluperfect Subjunctive': self.endings['sync_pluperfect_subj']
+        }
+        for tense, endings in tenses_to_process.items():
+            generated_forms = []
+            for end in endings:
+                if isinstance(end, list):
+                    sub_forms = []
+                    for sub_end in end:
+                        if sync_stem.endswith(('l', 'r')) and sub_end.startswith('r'):
+                            sub_forms.append(sync_stem + 'u' + sub_end)
+                        else:
+                            sub_forms.append(sync_stem + sub_end)
+                    generated_forms.append(pack_alternatives(sub_forms))
+                else:
+                    if sync_stem.endswith(('l', 'r')) and end.startswith('r'):
+                        generated_forms.append(sync_stem + 'u' + end)
+                    else:
+                        generated_forms.append(sync_stem + end)
+            sync_paradigm[tense] = generated_forms
+        sync_paradigm['Perfect Infinitive'] = sync_stem + self.endings['sync_perfect_inf']
+        return sync_paradigm
+
+    def _combine_participle_and_helpers(self, participle, helper_forms):
+        all_alts = []
+        for form_group in helper_forms:
+            if form_group == 'Ø': continue
+            all_alts.extend([alt.strip() for alt in alternatives(form_group)])
+        if not all_alts: return participle
+        standard_form = all_alts[0]
+        other_forms = sorted(list(set(all_alts[1:])))
+        return pack_alternatives([f"{participle} {standard_form}"] + other_forms)
+
+    def generate_derived_verbs(self, db):
+        derived_paradigms = {}
+        if self.is_inchoative or self.is_desiderative or 'iterative' in self.properties.get('derivation', []):
+            return {}
+        if self.supine_stem and not self.is_highly_irregular and not self.is_deponent:
+            iterative_stem = self.supine_stem + 'it'
+            p1_iter = iterative_stem + 'ō'
+            if db.find_verb(p1_iter):
+                derived_paradigms['Iterative Verb'] = {'Info': f"[see '{p1_iter}']", 'Paradigm': {}}
+            else:
+                iterative_data = {
+                    "lemma": p1_iter,
+                    "principal_parts": [iterative_stem + 'āre', iterative_stem + 'āvī', iterative_stem + 'ātum'],
+                    "conjugation": 1, "properties": {"derivation": ["iterative"]}
+                }
+                try:
+                    iterative_verb = Verb(iterative_data, self.endings, self.decliner, self.irregular_paradigms,
+                                          self._context)
+                    iterative_paradigm = iterative_verb.generate_paradigm()
+                    derived_paradigms['Iterative Verb'] = {'Info': f"{repr(iterative_verb)}",
+                                                           'Paradigm': iterative_paradigm}
+                except Exception as e:
+                    print(f"DEBUG: Could not generate iterative verb for {self.p1}: {e}")
+        if self.conjugation in [1, 2, 4] and not self.is_deponent and not self.is_highly_irregular:
+            theme_vowel = {'1': 'ā', '2': 'ē', '4': 'ī'}.get(str(self.conjugation))
+            inchoative_base = self.present_stem + (theme_vowel or '')
+            p1_incho = inchoative_base + 'scō'
+            if db.find_verb(p1_incho):
+                derived_paradigms['Inchoative Verb'] = {'Info': f"[see '{p1_incho}']", 'Paradigm': {}}
+            else:
+                p3_incho = self.p3 if not self.is_deponent and not self.is_semi_deponent else ""
+                inchoative_data = {
+                    "lemma": p1_incho,
+                    "principal_parts": [inchoative_base + 'scere', p3_incho, ""],
+                    "conjugation": 3,
+                    "properties": {"derivation": ["inchoative"], "semantic": self.properties.get('semantic', [])}
+                }
+                try:
+                    inchoative_verb = Verb(inchoative_data, self.endings, self.decliner, self.irregular_paradigms,
+                                           self._context)
+                    inchoative_paradigm = inchoative_verb.generate_paradigm()
+                    derived_paradigms['Inchoative Verb'] = {'Info': f"{repr(inchoative_verb)}",
+                                                            'Paradigm': inchoative_paradigm}
+                except Exception as e:
+                    print(f"DEBUG: Could not generate inchoative verb for {self.p1}: {e}")
+        if self.supine_stem:
+            desiderative_stem = self.supine_stem if self.supine_stem.endswith('ūr') else self.supine_stem + 'ūr'
+            p1_desid = desiderative_stem + 'iō'
+            if db.find_verb(p1_desid):
+                derived_paradigms['Desiderative Verb'] = {'Info': f"[see '{p1_desid}']", 'Paradigm': {}}
+            else:
+                desiderative_data = {
+                    "lemma": p1_desid,
+                    "principal_parts": [desiderative_stem + 'īre', "", ""],
+                    "conjugation": 4, "properties": {"derivation": ["desiderative"]}
+                }
+                try:
+                    desiderative_verb = Verb(desiderative_data, self.endings, self.decliner, self.irregular_paradigms,
+                                             self._context)
+                    desiderative_paradigm = desiderative_verb.generate_paradigm()
+                    derived_paradigms['Desiderative Verb'] = {'Info': f"{repr(desiderative_verb)}",
+                                                              'Paradigm': desiderative_paradigm}
+                except Exception as e:
+                    print(f"DEBUG: Could not generate desiderative verb for {self.p1}: {e}")
+        return derived_paradigms
+
+class LazyVerbMap(Mapping):
+    """
+    Lemma -> Verb mapping that keeps the raw lexicon entries and only builds a Verb (running
+    its tag parsing and stem rules) the first time that lemma is looked up. Iteration, len()
+    and `in` never build anything.
+    """
+
+    def __init__(self, build_verb):
+        self._build_verb = build_verb
+        self._entries = {}
+        self._built = {}
+
+    def add(self, lemma, entry):
+        self._entries[lemma] = entry
+        self._built.pop(lemma, None)
+
+    def __getitem__(self, lemma):
+        verb = self._built.get(lemma)
+        if verb is None:
+            verb = self._built.setdefault(lemma, self._build_verb(self._entries[lemma]))
+        return verb
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, lemma):
+        return lemma in self._entries
+
+    def built_count(self):
+        return len(self._built)
+
+    def entries(self):
+        """The raw entries by lemma, in lexicon order."""
+        return self._entries
+
+    def load(self, entries):
+        """Replaces every entry with `entries` (as returned by entries()); nothing is built."""
+        self._entries = entries
+        self._built = {}
+
+class LemmaAliasMap(Mapping):
+    """
+    Read-only view resolving alternative spellings of a lemma to the Verb in a LazyVerbMap.
+    Several lemmas can share an alias (abdicō and abdīcō are both 'abdico'): indexing returns
+    the last one added, as a plain dict would, while lemmas() and verbs() return all of them.
+    """
+
+    def __init__(self, verbs):
+        self._verbs = verbs
+        self._lemmas = {}
+
+    def add(self, alias, lemma):
+        lemmas = self._lemmas.setdefault(alias, [])
+        if lemma in lemmas:
+            lemmas.remove(lemma)
+        lemmas.append(lemma)
+
+    def lemmas(self, alias):
+        return tuple(self._lemmas.get(alias, ()))
+
+    def table(self):
+        """{alias: [lemma, ...]}, in the order the lemmas were added."""
+        return self._lemmas
+
+    def load(self, table):
+        self._lemmas = table
+
+    def verbs(self, alias):
+        return [self._verbs[lemma] for lemma in self._lemmas.get(alias, ())]
+
+    def __getitem__(self, alias):
+        return self._verbs[self._lemmas[alias][-1]]
+
+    def __iter__(self):
+        return iter(self._lemmas)
+
+    def __len__(self):
+        return len(self._lemmas)
+
+    def __contains__(self, alias):
+        return alias in self._lemmas
+
+class LatinDB:
+    def __init__(self, filepath, irregular_paradigms, verb_data_list=None, snapshot_index=None,
+                 paradigm_cache_size=DEFAULT_PARADIGM_CACHE_SIZE, disk_cache_path=None):
+        self.verbs = {}
+        self.demacronized_index = {}
+        self.tag_index = TagIndex({})
+        self.irregular_paradigms = irregular_paradigms
+        # THE FIX: It now uses the global constant.
+        self.endings = ENDINGS_DATA
+        self.decliner = AdjectiveDecliner()
+        self.verb_context = VerbContext(self.endings, self.decliner, self.irregular_paradigms)
+        self.paradigm_cache = ParadigmCache(paradigm_cache_size)
+        self.disk_cache = DiskParadigmCache(disk_cache_path) if disk_cache_path else None
+        self._fingerprint_salt = None
+        if snapshot_index is not None:
+            self.load_snapshot_index(snapshot_index)
+        elif verb_data_list is not None:
+            # The caller has already parsed the lexicon (see load_lexicon), so don't read it again.
+            self.load_entries(verb_data_list)
+        else:
+            self.load_data(filepath)
+
+    def load_data(self, filepath):
+        print(f"Loading Master Verb Database from '{filepath}'…")
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                verb_data_list = json.load(f)
+            self.load_entries(verb_data_list)
+        except FileNotFoundError:
+            print(f"FATAL ERROR: Database file not found at '{filepath}'.")
+            self.verbs = None
+        except json.JSONDecodeError as e:
+            print(f"FATAL ERROR: The file '{filepath}' is not a valid JSON file. Error: {e}")
+            self.verbs = None
+        except Exception as e:
+            import traceback
+            print(f"An unexpected error occurred during data loading: {e}")
+            traceback.print_exc()
+            self.verbs = None
+
+    # Verbs are built lazily (see LazyVerbMap): loading only indexes the raw entries.
+    def load_entries(self, verb_data_list):
+        self._reset_index(lambda verb_data: Verb(verb_data, self.endings, self.decliner, self.irregular_paradigms,
+                                                 self.verb_context))
+        verb_properties = {}
+        for verb_data in verb_data_list:
+            lemma = verb_data.get('lemma', '')
+            self._add_entry(lemma, verb_data)
+            verb_properties[lemma] = verb_data.get('properties', {})
+        self.tag_index = TagIndex(verb_properties)
+        print(f"Successfully loaded {len(self.verbs)} verbs from JSON.")
+
+    def snapshot_index(self):
+        """
+        The built lexicon index as plain data for lexicon_snapshot: every lemma's
+        Verb.to_record() tuple, marshalled on its own, plus the alias table and the tag
+        index's state. Builds every Verb.
+        """
+        records = {lemma: marshal.dumps(self.verbs[lemma].to_record()) for lemma in self.verbs}
+        return records, self.demacronized_index.table(), self.tag_index.state()
+
+    def load_snapshot_index(self, index):
+        """
+        Installs snapshot_index() output as it is: nothing is re-indexed, and a verb's record
+        is only unmarshalled when the Verb is first looked up.
+        """
+        records, aliases, tag_state = index
+        self._reset_index(lambda record: Verb.from_record(marshal.loads(record), self.verb_context))
+        self.verbs.load(records)
+        self.demacronized_index.load(aliases)
+        self.tag_index = TagIndex.from_state(tag_state)
+        print(f"Successfully loaded {len(self.verbs)} verbs from snapshot.")
+
+    def _reset_index(self, build_verb):
+        self.verbs = LazyVerbMap(build_verb)
+        self.demacronized_index = LemmaAliasMap(self.verbs)
+
+    def _add_entry(self, lemma, entry):
+        self.verbs.add(lemma, entry)
+        self.demacronized_index.add(demacronize(lemma), lemma)
+
+    def find_verb(self, lemma):
+        return self.verbs.get(lemma)
+
+    def get_paradigm(self, lemma):
+        """
+        The fully assembled paradigm of a lemma (see build_paradigm), or None if the lemma is
+        unknown. Results are shared through paradigm_cache and must not be mutated.
+        """
+        key = (lemma, engine_fingerprint())
+        paradigm = self.paradigm_cache.get(key)
+        if paradigm is None:
+            verb = self.find_verb(lemma)
+            if verb is None:
+                return None
+            paradigm = self._load_or_build(lemma, verb)
+            self.paradigm_cache.put(key, paradigm)
+        return paradigm
+
+    def prefetch_paradigm(self, lemma):
+        """
+        Puts `lemma`'s paradigm into the in-memory cache ahead of a request, like get_paradigm
+        but as background traffic: the hit and miss counters of both caches are left alone.
+        Returns the paradigm, or None if it was already in memory or the lemma is unknown.
+        """
+        key = (lemma, engine_fingerprint())
+        if key in self.paradigm_cache:
+            return None
+        verb = self.find_verb(lemma)
+        if verb is None:
+            return None
+        paradigm = self._load_or_build(lemma, verb, count=False)
+        self.paradigm_cache.put(key, paradigm)
+        return paradigm
+
+    def _load_or_build(self, lemma, verb, count=True):
+        if self.disk_cache is None:
+            return self.build_paradigm(verb)
+        fingerprint = self.paradigm_fingerprint(verb)
+        paradigm = self.disk_cache.get(lemma, fingerprint, count=count)
+        if paradigm is None:
+            paradigm = self.build_paradigm(verb)
+            self.disk_cache.put(lemma, fingerprint, paradigm)
+        return paradigm
+
+    def cached_paradigm(self, lemma):
+        """The paradigm of `lemma` if the in-memory cache already holds it, else None. Never builds."""
+        key = (lemma, engine_fingerprint())
+        return self.paradigm_cache.get(key) if key in self.paradigm_cache else None
+
+    def forget_paradigm(self, lemma):
+        """Drops `lemma` from the in-memory cache (the disk cache keeps it)."""
+        self.paradigm_cache.discard((lemma, engine_fingerprint()))
+
+    def paradigm_fingerprint(self, verb):
+        """
+        Digest of everything a verb's assembled paradigm is built from: its own lexicon entry
+        and irregular paradigm, plus a database-wide salt covering the engine rules, the 'sum'
+        auxiliaries used by every passive perfect and the set of lemmas (derived verbs only
+        link to existing ones).
+        """
+        if self._fingerprint_salt is None:
+            salt = hashlib.sha256(engine_fingerprint().encode('utf-8'))
+            salt.update(json.dumps(self.irregular_paradigms.get('sum'), ensure_ascii=False,
+                                   sort_keys=True).encode('utf-8'))
+            salt.update('\n'.join(sorted(self.verbs)).encode('utf-8'))
+            self._fingerprint_salt = salt.digest()
+        entry = [verb.lemma, verb.principal_parts, verb.conjugation_num, verb.properties,
+                 self.irregular_paradigms.get(verb.p1)]
+        digest = hashlib.sha256(self._fingerprint_salt)
+        digest.update(json.dumps(entry, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def build_paradigm(self, verb):
+        """
+        Generated paradigm + hand-written irregular forms, laid out on MASTER_TEMPLATE, with the
+        archaic tenses and derived verbs filled in. This is what the GUI displays.
+        """
+        final_paradigm = verb.generate_paradigm()
+
+        if verb.p1 in self.irregular_paradigms:
+            def deep_merge_dicts(base, override):
+                for key, val in override.items():
+                    if key in base and isinstance(base.get(key), dict) and isinstance(val, dict):
+                        deep_merge_dicts(base[key], val)
+                    else:
+                        base[key] = val
+
+            deep_merge_dicts(final_paradigm, self.irregular_paradigms[verb.p1])
+
+        scaffold = new_master_scaffold()
+
+        def merge_into_scaffold(base, generated):
+            for key, gen_val in generated.items():
+                if key in base and isinstance(base.get(key), dict) and isinstance(gen_val, dict):
+                    merge_into_scaffold(base[key], gen_val)
+                else:
+                    base[key] = gen_val
+
+        merge_into_scaffold(scaffold, final_paradigm)
+
+        target_dict_act = scaffold['INDICATIVE ACTIVE']
+        target_dict_act['Future Perfect II (Archaic)'] = verb._generate_archaic_future()
+        target_dict_act['Future (Archaic -bō)'] = verb._generate_archaic_bo_future('active')
+        target_dict_subj_act = scaffold['SUBJUNCTIVE ACTIVE']
+        target_dict_subj_act['Aorist Subjunctive (Archaic)'] = verb._generate_aorist_subjunctive()
+        target_dict_subj_act['Archaic Optative (Theoretical)'] = verb._generate_archaic_optative()
+        target_dict_pass = scaffold['INDICATIVE PASSIVE']
+        if not verb.is_deponent:
+            target_dict_pass['Future (Archaic -bō)'] = verb._generate_archaic_bo_future('passive')
+
+        derived_verbs = verb.generate_derived_verbs(self)
+        if derived_verbs:
+            scaffold['DERIVED VERBS'] = derived_verbs
+        # The engine carries alternatives as tuples; consumers read them joined with ' / '.
+        return join_alternatives(scaffold)
+
+def load_irregular_paradigms(filepath='irregular_paradigms.json'):
+    """Returns the hand-written irregular paradigms, {} if the file is missing, or None if it is invalid."""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            irregular_paradigms = json.load(f)
+        print("Successfully loaded irregular paradigms.")
+    except FileNotFoundError:
+        print(f"Warning: '{filepath}' not found. Irregular verbs may not conjugate correctly.")
+        irregular_paradigms = {}
+    except json.JSONDecodeError as e:
+        print(f"FATAL ERROR: '{filepath}' is invalid. Error: {e}")
+        return None
+    return irregular_paradigms
+
+def complete_sum_paradigm(irregular_paradigms, verb_data_list):
+    """
+    Fills the gaps of the hand-written 'sum' paradigm with the generated one, in place.
+    Every passive perfect borrows its auxiliaries from this entry, so it must be complete
+    before any paradigm is generated.
+    """
+    sum_data = next((v for v in verb_data_list if v.get('lemma') == 'sum'), None)
+    if not sum_data or 'sum' not in irregular_paradigms:
+        return
+
+    temp_sum_obj = Verb(sum_data, ENDINGS_DATA, AdjectiveDecliner(), irregular_paradigms)
+    sum_generated_paradigm = temp_sum_obj.generate_paradigm()
+
+    complete_sum = merge_paradigms(copy.deepcopy(irregular_paradigms['sum']), sum_generated_paradigm)
+    irregular_paradigms['sum'] = join_alternatives(complete_sum)
+
+def load_lexicon(verbs_path='verbs_Cicero.json', irregular_path='irregular_paradigms.json', snapshot_path=None,
+                 paradigm_cache_size=DEFAULT_PARADIGM_CACHE_SIZE, disk_cache_path=None):
+    """
+    Builds a ready-to-use LatinDB, parsing each JSON file exactly once: the same verb list
+    feeds both the 'sum' completion and the database. Returns None on a fatal error.
+
+    With a snapshot_path, a fresh compiled snapshot (see lexicon_snapshot) is loaded instead of
+    the JSON; a missing or stale one is rebuilt from the JSON and written back. A disk_cache_path
+    backs get_paradigm() with a persistent SQLite store (see DiskParadigmCache).
+    """
+    if snapshot_path is not None:
+        import lexicon_snapshot
+        try:
+            source_hashes = lexicon_snapshot.hash_sources(verbs_path, irregular_path)
+            snapshot = lexicon_snapshot.read_snapshot(snapshot_path, source_hashes)
+        except FileNotFoundError:
+            # A missing source file is reported by the JSON path below; nothing to snapshot then.
+            source_hashes, snapshot = None, None
+        if snapshot is not None:
+            irregular_paradigms, index = snapshot
+            print(f"Loading Master Verb Database from snapshot '{snapshot_path}'…")
+            return LatinDB(verbs_path, irregular_paradigms, snapshot_index=index,
+                           paradigm_cache_size=paradigm_cache_size, disk_cache_path=disk_cache_path)
+
+    irregular_paradigms = load_irregular_paradigms(irregular_path)
+    if irregular_paradigms is None:
+        return None
+
+    print(f"Loading Master Verb Database from '{verbs_path}'…")
+    try:
+        with open(verbs_path, 'r', encoding='utf-8') as f:
+            verb_data_list = json.load(f)
+    except FileNotFoundError:
+        print(f"FATAL ERROR: Database file not found at '{verbs_path}'.")
+        return None
+    except json.JSONDecodeError as e:
+        print(f"FATAL ERROR: The file '{verbs_path}' is not a valid JSON file. Error: {e}")
+        return None
+
+    try:
+        complete_sum_paradigm(irregular_paradigms, verb_data_list)
+    except Exception as e:
+        print(f"Critical error during pre-setup of 'sum': {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+    db = LatinDB(verbs_path, irregular_paradigms, verb_data_list, paradigm_cache_size=paradigm_cache_size,
+                 disk_cache_path=disk_cache_path)
+    if snapshot_path is not None and source_hashes is not None:
+        lexicon_snapshot.write_snapshot(snapshot_path, source_hashes, db)
+    return db
+
+def generate_compound_paradigm(compound_lemma, compound_map, base_paradigms):
+
+    if compound_lemma not in compound_map:
+        return None
+
+    base_verb, prefix_normal, prefix_vowel = compound_map[compound_lemma]
+
+    if base_verb not in base_paradigms:
+        print(f"Warning: Base verb '{base_verb}' for '{compound_lemma}' not found in lookup.")
+        return None
+
+    base_paradigm = copy.deepcopy(base_paradigms[base_verb])
+    base_paradigm.pop('Verb Info', None)
+
+    def apply_prefix(data):
+        if isinstance(data, str):
+            if data.strip() == '-':
+                return data
+            if ' / ' in data:
+                parts = data.split(' / ')
+                return ' / '.join([apply_prefix(part) for part in parts])
+            if ' ' in data:
+                parts = data.split(' ')
+                return ' '.join([apply_prefix(parts[0])] + parts[1:])
+
+            if data in ['fers', 'fert', 'fer', 'ferte']:
+
+                if prefix_vowel.endswith('f'):
+                    return prefix_vowel + data
+                return prefix_normal + data
+
+            first_char = data[0] if data else ''
+
+            if first_char in 'aeiouāēīōū':
+                return prefix_vowel + data
+
+            elif prefix_vowel.endswith(first_char):
+                return prefix_vowel + data
+
+            else:
+                return prefix_normal + data
+
+        elif isinstance(data, tuple):
+            return tuple(apply_prefix(part) for part in data)
+        elif isinstance(data, list):
+            return [apply_prefix(item) for item in data]
+        elif isinstance(data, dict):
+            return {key: apply_prefix(value) for key, value in data.items()}
+        else:
+            return data
+
+    new_paradigm = apply_prefix(base_paradigm)
+    new_paradigm['Verb Info'] = f"{compound_lemma} (Compound of {base_verb})"
+    return new_paradigm
+
+
+def apply_prefix_with_assimilation(prefix, root_word):
+
+    if not root_word or root_word.strip() == '-': return root_word
+    first_char = root_word.strip()[0]
+
+    if prefix == 'ad':
+        if first_char in 'cqv': return 'ac' + root_word
+        if first_char == 'f': return 'af' + root_word
+        if first_char == 'g': return 'ag' + root_word
+        if first_char == 'l': return 'al' + root_word
+        if first_char == 'n': return 'an' + root_word
+        if first_char == 'p': return 'ap' + root_word
+        if first_char == 'r': return 'ar' + root_word
+        if first_char == 's': return 'as' + root_word
+        if first_char == 't': return 'at' + root_word
+    elif prefix == 'sub':
+        if first_char == 'c': return 'suc' + root_word
+        if first_char == 'f': return 'suf' + root_word
+        if first_char == 'g': return 'sug' + root_word
+        if first_char == 'p': return 'sup' + root_word
+        if first_char == 'm': return 'sum' + root_word
+    elif prefix == 'in':
+        if first_char in 'lr': return 'i' + first_char + root_word
+        if first_char in 'bmp': return 'im' + root_word
+    elif prefix == 'ob':
+        if first_char == 'c': return 'oc' + root_word
+        if first_char == 'f': return 'of' + root_word
+        if first_char == 'p': return 'op' + root_word
+    elif prefix == 'con':
+        if first_char in 'lr': return 'co' + first_char + root_word
+        if first_char in 'bmp': return 'com' + root_word
+    elif prefix == 'dis':
+        if first_char == 'f': return 'dif' + root_word
+    elif prefix == 'ex':
+        if first_char == 'f': return 'ef' + root_word
+    elif prefix == 'ab' and first_char == 'f':
+        return 'au' + root_word  # aufero
+
+    if prefix == 're' and first_char in 'aeiouāēīōū': return 'red' + root_word
+    if prefix == 'prō' and first_char in 'aeiouāēīōū': return 'prōd' + root_word
+
+    return prefix + root_word
+
+def generate_compound_paradigm(compound_verb, base_paradigms):
+
+    base_paradigm = copy.deepcopy(base_paradigms.get(compound_verb.base_verb_lemma))
+    if not base_paradigm:
+        print(f"Warning: Base verb '{compound_verb.base_verb_lemma}' for '{compound_verb.p1}' not found in lookup.")
+        return {}
+
+    base_paradigm.pop('Verb Info', None)
+
+    def prefix_all_forms(data):
+        if isinstance(data, str):
+            if ' / ' in data: return ' / '.join([prefix_all_forms(part) for part in data.split(' / ')])
+            if ' ' in data:
+                parts = data.split(' ');
+                return ' '.join([prefix_all_forms(parts[0])] + parts[1:])
+            return apply_prefix_with_assimilation(compound_verb.true_prefix, data)
+        elif isinstance(data, tuple):
+            return tuple(prefix_all_forms(part) for part in data)
+        elif isinstance(data, list):
+            return [prefix_all_forms(item) for item in data]
+        elif isinstance(data, dict):
+            return {key: prefix_all_forms(value) for key, value in data.items()}
+        else:
+            return data
+
+    new_paradigm = prefix_all_forms(base_paradigm)
+    return new_paradigm
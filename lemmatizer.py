@@ -0,0 +1,125 @@
+"""Streaming lemmatizer for running Latin text.
+
+The pipeline is a chain of generators, so memory stays bounded by the analyzer
+indexes and one line (or, with workers, a bounded window of line batches)
+whatever the corpus size:
+
+    read lines -> tokenize -> normalise orthography -> analyse -> emit
+
+Normalisation folds case, macrons, j -> i and v -> u, on both the corpus
+tokens and the generated forms, so 'Iuvat', 'juvat' and 'iūvat' all meet the
+same key. Tokens that are not found are retried without the enclitics -que,
+-ne and -ve.
+"""
+import contextlib
+import itertools
+import os
+import re
+from collections import deque
+from multiprocessing import Pool
+
+from latin_engine import load_lexicon
+from form_analyzer import FormIndex, DemacronizedFormIndex, plain_key
+
+TOKEN_RE = re.compile(r"[^\W\d_]+")
+ENCLITICS = ('que', 'ne', 've')
+ORTHOGRAPHY_MAP = str.maketrans('jv', 'iu')
+
+_worker_index = None
+
+
+def orthographic_key(form):
+    """Case-, macron- and u/v, i/j-insensitive spelling of a form."""
+    return plain_key(form).translate(ORTHOGRAPHY_MAP)
+
+
+def build_corpus_index(db):
+    """The analyzer the pipeline runs on: every generated form, keyed by orthographic_key."""
+    return DemacronizedFormIndex(FormIndex.build(db), key=orthographic_key)
+
+
+def tokenize(lines):
+    """Yields (line number, token) for every word in an iterable of text lines."""
+    for line_no, line in enumerate(lines, 1):
+        for match in TOKEN_RE.finditer(line):
+            yield line_no, match.group()
+
+
+def analyze_token(index, token):
+    """
+    {'token', 'enclitic', 'candidates'}, where each candidate is a macronized form with
+    its analyses (lemma, category, tense, slot).
+    """
+    enclitic = ''
+    candidates = index.analyze(token)
+    if not candidates:
+        lowered = token.lower()
+        for suffix in ENCLITICS:
+            if lowered.endswith(suffix) and len(lowered) > len(suffix) + 1:
+                candidates = index.analyze(token[:-len(suffix)])
+                if candidates:
+                    enclitic = suffix
+                    break
+    return {
+        'token': token,
+        'enclitic': enclitic,
+        'candidates': [{'form': form, 'analyses': [a._asdict() for a in analyses]}
+                       for form, analyses in candidates],
+    }
+
+
+def lemmatize(lines, index):
+    """Streams one result per token of `lines`: analyze_token() output plus its line number."""
+    for line_no, token in tokenize(lines):
+        result = analyze_token(index, token)
+        result['line'] = line_no
+        yield result
+
+
+def _init_worker(verbs_path, irregular_path, snapshot_path):
+    global _worker_index
+    if _worker_index is not None:
+        return  # Inherited from the parent through fork().
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        db = load_lexicon(verbs_path, irregular_path, snapshot_path=snapshot_path)
+        _worker_index = build_corpus_index(db)
+
+
+def _lemmatize_batch(batch):
+    first_line, lines = batch
+    results = []
+    for result in lemmatize(lines, _worker_index):
+        result['line'] += first_line - 1
+        results.append(result)
+    return results
+
+
+def lemmatize_parallel(lines, workers, verbs_path, irregular_path, snapshot_path=None, index=None,
+                       batch_lines=2000):
+    """
+    Same results, in the same order, as lemmatize(), computed on a process pool. At most
+    2 * workers batches of `batch_lines` lines are in flight, so a multi-gigabyte input is
+    never read ahead of the workers. Passing an already built `index` lets fork()ed workers
+    share it instead of building their own.
+    """
+    global _worker_index
+    _worker_index = index
+    pool = Pool(workers, initializer=_init_worker, initargs=(verbs_path, irregular_path, snapshot_path))
+    try:
+        pending = deque()
+        line_iter = iter(lines)
+        next_line = 1
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(itertools.islice(line_iter, batch_lines))
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_lemmatize_batch, ((next_line, chunk),)))
+                next_line += len(chunk)
+            if not pending:
+                break
+            yield from pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+        _worker_index = None
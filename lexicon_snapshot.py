@@ -0,0 +1,75 @@
+"""Compiled snapshot of the lexicon for fast start-up.
+
+A snapshot holds the 'sum'-completed irregular paradigms and the lexicon index
+LatinDB builds on load (LatinDB.snapshot_index): the demacronized alias table,
+the tag index's bitsets and each lemma's Verb.to_record() tuple, marshalled on
+its own. Loading it installs those as they are, so it skips the JSON parse, the
+indexing of every entry and the tag index; a verb's record is only decoded,
+skipping the tag parsing / stem rules in Verb.__init__, when it is looked up.
+Its header records the SHA-256 of both source JSON files, the engine
+fingerprint and the Python version (marshal's format may change between
+releases); a snapshot whose header does not match is treated as stale and
+rebuilt by latin_engine.load_lexicon().
+
+Everything in a snapshot is plain data (dicts, lists, tuples, strings, numbers,
+bytes), so it is written with marshal rather than pickle: loading it never
+imports or runs code. marshal is not hardened against deliberately malformed
+files, though, so snapshots remain local build artefacts written by this module.
+"""
+import hashlib
+import marshal
+import os
+import sys
+
+from latin_engine import engine_fingerprint
+
+SNAPSHOT_FORMAT = 4
+
+
+def default_snapshot_path(verbs_path):
+    return os.path.splitext(verbs_path)[0] + '.snapshot'
+
+
+def hash_sources(verbs_path, irregular_path):
+    hashes = {}
+    for path in (verbs_path, irregular_path):
+        with open(path, 'rb') as f:
+            hashes[os.path.basename(path)] = hashlib.sha256(f.read()).hexdigest()
+    return hashes
+
+
+def _header(source_hashes):
+    return {'format': SNAPSHOT_FORMAT, 'engine': engine_fingerprint(), 'sources': source_hashes,
+            'python': tuple(sys.version_info[:2])}
+
+
+def read_snapshot(snapshot_path, source_hashes):
+    """Returns (irregular_paradigms, index), or None if the snapshot is missing, unreadable or stale."""
+    try:
+        # One read and marshal.loads: marshal.load() on a file object goes through many small reads.
+        with open(snapshot_path, 'rb') as f:
+            header, payload = marshal.loads(f.read())
+        if header != _header(source_hashes):
+            print(f"Snapshot '{snapshot_path}' is stale; rebuilding from JSON.")
+            return None
+        return payload
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: could not read snapshot '{snapshot_path}' ({e}); rebuilding from JSON.")
+        return None
+
+
+def write_snapshot(snapshot_path, source_hashes, db):
+    payload = (db.irregular_paradigms, db.snapshot_index())
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps((_header(source_hashes), payload)))
+        # Atomic rename, so concurrent workers never see a half-written snapshot.
+        os.replace(tmp_path, snapshot_path)
+        print(f"Wrote lexicon snapshot '{snapshot_path}'.")
+    except (OSError, ValueError) as e:  # ValueError: a value marshal cannot store
+        print(f"Warning: could not write snapshot '{snapshot_path}': {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,108 @@
+"""Restores vowel length in Latin text written without macrons.
+
+Every word is looked up in the lemmatizer's corpus index, i.e. in the space of
+forms the paradigm generator produces (with macronize's shortening rules
+already applied), never in an external dictionary. A word whose candidates all
+agree on one macronized spelling is rewritten; one with several is left as
+written and reported with every candidate; one the engine cannot generate is
+left as written. Case, u/v and i/j spellings and any macrons already present
+in the input are kept, and candidates that contradict input macrons are
+discarded.
+
+Like the lemmatizer, restoration streams line by line, so memory does not grow
+with the size of the input.
+"""
+import time
+
+from latin_engine import demacronize
+from lemmatizer import TOKEN_RE, analyze_token
+
+LENGTHEN_MAP = str.maketrans('aeiouAEIOU', 'āēīōūĀĒĪŌŪ')
+
+
+class RestorationStats:
+    """Running counts of a restore_lines() stream."""
+
+    def __init__(self):
+        self.tokens = 0
+        self.resolved = 0
+        self.ambiguous = 0
+        self.unknown = 0
+        self.started = time.perf_counter()
+
+    @property
+    def seconds(self):
+        return time.perf_counter() - self.started
+
+    @property
+    def tokens_per_second(self):
+        seconds = self.seconds
+        return self.tokens / seconds if seconds > 0 else 0.0
+
+    def summary(self):
+        return (f"{self.tokens:,} tokens: {self.resolved:,} resolved, {self.ambiguous:,} ambiguous, "
+                f"{self.unknown:,} unknown ({self.tokens_per_second:,.0f} tokens/s)")
+
+
+def transfer_macrons(word, form):
+    """
+    `word` with the vowel lengths of `form`, a spelling of it that differs only in case,
+    macrons, u/v and i/j. Returns None when `word` has a macron that `form` lacks.
+    """
+    if len(word) != len(form):
+        return None
+    chars = []
+    for written, generated in zip(word, form):
+        if generated != demacronize(generated):
+            chars.append(written.translate(LENGTHEN_MAP))
+        elif written != demacronize(written):
+            return None
+        else:
+            chars.append(written)
+    return ''.join(chars)
+
+
+def restore_token(index, token):
+    """
+    (spellings, analysis): every distinct macronized spelling of `token` the engine can
+    generate, in index order, and analyze_token()'s result for it.
+    """
+    analysis = analyze_token(index, token)
+    enclitic = analysis['enclitic']
+    base, suffix = (token[:-len(enclitic)], token[-len(enclitic):]) if enclitic else (token, '')
+    spellings = []
+    for candidate in analysis['candidates']:
+        spelling = transfer_macrons(base, candidate['form'])
+        if spelling is not None and spelling + suffix not in spellings:
+            spellings.append(spelling + suffix)
+    return spellings, analysis
+
+
+def restore_lines(lines, index, stats=None, on_ambiguous=None):
+    """
+    Yields each line of `lines` with vowel length restored. `on_ambiguous(line_no, token,
+    spellings)` is called for every word left as written because it has several spellings.
+    """
+    if stats is None:
+        stats = RestorationStats()
+    for line_no, line in enumerate(lines, 1):
+        pieces = []
+        end = 0
+        for match in TOKEN_RE.finditer(line):
+            token = match.group()
+            spellings, _ = restore_token(index, token)
+            stats.tokens += 1
+            if len(spellings) == 1:
+                stats.resolved += 1
+                token = spellings[0]
+            elif spellings:
+                stats.ambiguous += 1
+                if on_ambiguous is not None:
+                    on_ambiguous(line_no, token, spellings)
+            else:
+                stats.unknown += 1
+            pieces.append(line[end:match.start()])
+            pieces.append(token)
+            end = match.end()
+        pieces.append(line[end:])
+        yield ''.join(pieces)
@@ -0,0 +1,74 @@
+"""Packed alternative forms and the merge of nested paradigm dicts.
+
+The engine and its consumers exchange paradigms as nested dicts (mood/voice ->
+tense -> list of six persons, NON-FINITE -> ... -> participle cases), with the
+alternatives of a cell joined by ' / '. Inside the engine a form is a bare str,
+or a tuple of its alternatives when it has several ('amāvisse / amāsse' ->
+('amāvisse', 'amāsse')), the same packing FormIndex uses for analyses. 'Ø'
+stays a str.
+
+Verb.generate_paradigm writes its forms packed this way, so no cell is joined
+and split again on the way; build_paradigm joins the alternatives once, with
+join_alternatives(), when it hands the paradigm out. merge_paradigms() is how
+complete_sum_paradigm fills the gaps of the hand-written 'sum' at lexicon load.
+"""
+ALTERNATIVE_SEPARATOR = ' / '
+
+
+def alternatives(value):
+    """The alternatives of a packed form as a tuple."""
+    return (value,) if isinstance(value, str) else value
+
+
+def pack_alternatives(forms):
+    """The packed form of a sequence of alternatives: the form itself if there is only one."""
+    return forms[0] if len(forms) == 1 else tuple(forms)
+
+
+def join_alternatives(tree):
+    """
+    Joins, in place, every tuple of alternatives in a nested paradigm dict with ' / ', the
+    form the display and JSON consumers read. Lists holding no tuple are left untouched, so
+    lists shared with the irregular paradigms are never written to. Returns `tree`.
+    """
+    join = ALTERNATIVE_SEPARATOR.join
+    for key, value in tree.items():
+        kind = value.__class__
+        if kind is tuple:
+            tree[key] = join(value)
+        elif kind is list:
+            for i, item in enumerate(value):
+                if item.__class__ is tuple:
+                    value[i] = join(item)
+        elif kind is dict:
+            join_alternatives(value)
+    return tree
+
+
+def merge_paradigms(base, override):
+    """
+    Deep-merges the nested paradigm dict `override` into `base`, in place. A list leaf both
+    have holds, slot by slot, the sorted union of both sides' alternatives ('Ø' dropped, ''
+    if nothing is left); for any other leaf `override` wins. Either side may hold joined or
+    packed forms; the merged lists hold packed ones. Returns `base`.
+    """
+    for key, value in override.items():
+        mine = base.get(key)
+        if isinstance(mine, dict) and isinstance(value, dict):
+            merge_paradigms(mine, value)
+        elif isinstance(mine, list) and isinstance(value, list):
+            base[key] = [_union(mine[i] if i < len(mine) else '', value[i] if i < len(value) else '')
+                         for i in range(max(len(mine), len(value)))]
+        else:
+            base[key] = value
+    return base
+
+
+def _split(value):
+    return value.split(ALTERNATIVE_SEPARATOR) if isinstance(value, str) else value
+
+
+def _union(first, second):
+    forms = sorted(dict.fromkeys(form.strip() for form in (*_split(first), *_split(second))
+                                 if form and form.strip() != 'Ø'))
+    return pack_alternatives(forms) if forms else ''
@@ -0,0 +1,133 @@
+"""Caches for fully assembled paradigms: an in-process LRU and a persistent SQLite store."""
+import json
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_PARADIGM_CACHE_SIZE = 256
+
+
+def default_disk_cache_path(verbs_path):
+    return os.path.splitext(verbs_path)[0] + '.paradigms.sqlite3'
+
+
+class ParadigmCache:
+    """
+    Bounded least-recently-used cache. Keys are (lemma, engine fingerprint) pairs, so
+    paradigms built by an older rule set are never served. Cached paradigms are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize=DEFAULT_PARADIGM_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def resize(self, maxsize):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+
+class DiskParadigmCache:
+    """
+    Read-through SQLite store of assembled paradigms that survives restarts and is shared by
+    every process pointing at the same file. Each row remembers the fingerprint it was built
+    from (see LatinDB.paradigm_fingerprint); a row whose fingerprint no longer matches is
+    treated as a miss and overwritten.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Imported here so that processes without a disk cache don't pay for loading sqlite3.
+        import sqlite3
+        # One connection shared by all threads of this process, serialised by self._lock.
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            # WAL lets several worker processes read while one of them writes.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS paradigms ("
+                               "lemma TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, paradigm TEXT NOT NULL)")
+
+    def get(self, lemma, fingerprint, count=True):
+        """The stored paradigm, or None. count=False leaves hits/misses alone (prefetching)."""
+        with self._lock:
+            row = self._conn.execute("SELECT fingerprint, paradigm FROM paradigms WHERE lemma = ?",
+                                     (lemma,)).fetchone()
+            if row is None or row[0] != fingerprint:
+                if count:
+                    self.misses += 1
+                return None
+            if count:
+                self.hits += 1
+        return json.loads(row[1])
+
+    def put(self, lemma, fingerprint, paradigm):
+        payload = json.dumps(paradigm, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO paradigms (lemma, fingerprint, paradigm) VALUES (?, ?, ?)",
+                               (lemma, fingerprint, payload))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM paradigms")
+            self.hits = self.misses = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM paradigms").fetchone()[0]
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self), 'path': self.path}
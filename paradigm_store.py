@@ -0,0 +1,236 @@
+"""Precomputed, memory-mapped store of every assembled paradigm in the lexicon.
+
+Layout of a store file (all integers in native byte order, recorded in the header):
+
+    magic                 8 bytes, b'ECCEPST1'
+    header length         uint64
+    header                UTF-8 JSON: lemmas, cell paths, engine fingerprint,
+                          source hashes and the byte range of each section below
+    offsets               uint32[n_lemmas * n_cells]  start of each cell in the blob
+    lengths               uint16[n_lemmas * n_cells]  byte length, MISSING if absent
+    order_index           uint32[n_lemmas + 1]        slice of `order` per lemma
+    order                 uint16[...]                 cell ids of a lemma in paradigm order
+    blob                  UTF-8 strings, each distinct string stored once
+
+A cell is one leaf of an assembled paradigm, addressed by its key path joined
+with CELL_SEP, e.g. 'INDICATIVE ACTIVE|Present|0' or
+'NON-FINITE|PARTICIPLES|PPP|M|Nom Sg'. Looking a cell up costs two array
+reads and returns a memoryview slice of the mapped file: no string is decoded
+and no Python objects are built unless the caller asks for text. Every process
+opening the same file shares its pages through the OS page cache.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from latin_engine import engine_fingerprint
+
+MAGIC = b'ECCEPST1'
+STORE_FORMAT = 1
+CELL_SEP = '|'
+MISSING = 0xFFFF
+# Path components marking an empty list / dict, so paradigm() can rebuild them exactly.
+EMPTY_LIST, EMPTY_DICT = '[]', '{}'
+
+
+def default_store_path(verbs_path):
+    return os.path.splitext(verbs_path)[0] + '.paradigms.store'
+
+
+def flatten_paradigm(paradigm, prefix=()):
+    """Yields (path, text) for every leaf of a nested paradigm, in paradigm order."""
+    if isinstance(paradigm, dict):
+        if not paradigm:
+            yield prefix + (EMPTY_DICT,), ''
+        for key, value in paradigm.items():
+            yield from flatten_paradigm(value, prefix + (key,))
+    elif isinstance(paradigm, list):
+        if not paradigm:
+            yield prefix + (EMPTY_LIST,), ''
+        for i, value in enumerate(paradigm):
+            yield from flatten_paradigm(value, prefix + (str(i),))
+    else:
+        yield prefix, paradigm
+
+
+def unflatten_paradigm(cells):
+    """Inverse of flatten_paradigm for an ordered iterable of (path, text)."""
+    root = {}
+    for path, text in cells:
+        node = root
+        for key, next_key in zip(path, path[1:]):
+            if isinstance(node, list):
+                key = int(key)
+                if key == len(node):
+                    node.append(None)
+            child = node[key] if not isinstance(node, dict) else node.get(key)
+            if child is None:
+                child = [] if next_key.isdigit() or next_key == EMPTY_LIST else {}
+                node[key] = child
+            node = child
+        last = path[-1]
+        if last in (EMPTY_LIST, EMPTY_DICT):
+            continue
+        if isinstance(node, list):
+            node.append(text)
+        else:
+            node[last] = text
+    return root
+
+
+def _aligned(f):
+    padding = -f.tell() % 8
+    f.write(b'\0' * padding)
+    return f.tell()
+
+
+def build_store(db, path, lemmas=None, source_hashes=None, progress=None):
+    """
+    Generates the assembled paradigm of every lemma (default: the whole lexicon) and writes
+    them to a store file at `path`. This is the offline step; serving only opens the result.
+    """
+    lemmas = sorted(db.verbs) if lemmas is None else list(lemmas)
+    cell_ids = {}
+    rows = []
+    for n, lemma in enumerate(lemmas, 1):
+        row = []
+        for cell_path, text in flatten_paradigm(db.build_paradigm(db.find_verb(lemma))):
+            cell = CELL_SEP.join(cell_path)
+            row.append((cell_ids.setdefault(cell, len(cell_ids)), text))
+        rows.append(row)
+        if progress:
+            progress(n, len(lemmas))
+    if len(cell_ids) >= MISSING:
+        raise ValueError(f"Too many distinct cells for a uint16 cell id: {len(cell_ids)}")
+
+    n_cells = len(cell_ids)
+    offsets = array('I', bytes(4 * len(lemmas) * n_cells))
+    lengths = array('H', [MISSING]) * (len(lemmas) * n_cells)
+    order_index = array('I', [0])
+    order = array('H')
+    blob = bytearray()
+    interned = {}
+    for lemma_id, row in enumerate(rows):
+        base = lemma_id * n_cells
+        for cell_id, text in row:
+            data = text.encode('utf-8')
+            if len(data) >= MISSING:
+                raise ValueError(f"Cell too long for the store: {lemmas[lemma_id]!r}")
+            start = interned.get(data)
+            if start is None:
+                start = interned[data] = len(blob)
+                blob += data
+            offsets[base + cell_id] = start
+            lengths[base + cell_id] = len(data)
+            order.append(cell_id)
+        order_index.append(len(order))
+
+    header = {
+        'format': STORE_FORMAT, 'byteorder': sys.byteorder, 'engine': engine_fingerprint(),
+        'sources': source_hashes or {}, 'lemmas': lemmas, 'cells': list(cell_ids), 'sections': {},
+    }
+    sections = [('offsets', offsets), ('lengths', lengths), ('order_index', order_index), ('order', order),
+                 ('blob', blob)]
+    # Section positions depend on the header size, so reserve room for them with a dry run.
+    header['sections'] = {name: [0, 0] for name, _ in sections}
+    header_size = len(json.dumps(header, ensure_ascii=False).encode('utf-8')) + 256
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<Q', header_size) + b' ' * header_size)
+        for name, data in sections:
+            start = _aligned(f)
+            f.write(data)
+            header['sections'][name] = [start, f.tell() - start]
+        encoded = json.dumps(header, ensure_ascii=False).encode('utf-8')
+        if len(encoded) > header_size:
+            raise ValueError("Store header outgrew its reserved space")
+        f.seek(len(MAGIC) + 8)
+        f.write(encoded)
+    os.replace(tmp_path, path)
+
+
+class ParadigmStore:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"'{path}' is not a paradigm store")
+        (header_size,) = struct.unpack_from('<Q', self._mm, len(MAGIC))
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(self._mm[header_start:header_start + header_size]).decode('utf-8'))
+        if header['format'] != STORE_FORMAT or header['byteorder'] != sys.byteorder:
+            self._mm.close()
+            raise ValueError(f"'{path}' was written in an incompatible format; rebuild it")
+        self.header = header
+        self.lemmas = header['lemmas']
+        self.cells = header['cells']
+        self._lemma_ids = {lemma: i for i, lemma in enumerate(self.lemmas)}
+        self._cell_ids = {cell: i for i, cell in enumerate(self.cells)}
+        self._n_cells = len(self.cells)
+
+        self._view = memoryview(self._mm)
+        def section(name, typecode):
+            start, size = header['sections'][name]
+            raw = self._view[start:start + size]
+            return raw.cast(typecode) if typecode else raw
+        self._offsets = section('offsets', 'I')
+        self._lengths = section('lengths', 'H')
+        self._order_index = section('order_index', 'I')
+        self._order = section('order', 'H')
+        self._blob = section('blob', None)
+
+    def is_fresh(self, source_hashes):
+        return self.header['engine'] == engine_fingerprint() and self.header['sources'] == source_hashes
+
+    def __contains__(self, lemma):
+        return lemma in self._lemma_ids
+
+    def __len__(self):
+        return len(self.lemmas)
+
+    def cell(self, lemma, cell):
+        """Zero-copy memoryview of one cell's UTF-8 bytes, or None if the verb or cell is absent."""
+        lemma_id = self._lemma_ids.get(lemma)
+        cell_id = self._cell_ids.get(cell)
+        if lemma_id is None or cell_id is None:
+            return None
+        i = lemma_id * self._n_cells + cell_id
+        length = self._lengths[i]
+        if length == MISSING:
+            return None
+        start = self._offsets[i]
+        return self._blob[start:start + length]
+
+    def cell_text(self, lemma, cell):
+        data = self.cell(lemma, cell)
+        return None if data is None else str(data, 'utf-8')
+
+    def paradigm(self, lemma):
+        """Rebuilds the full nested paradigm of a lemma, identical to LatinDB.build_paradigm()."""
+        lemma_id = self._lemma_ids.get(lemma)
+        if lemma_id is None:
+            return None
+        base = lemma_id * self._n_cells
+        cells = []
+        for cell_id in self._order[self._order_index[lemma_id]:self._order_index[lemma_id + 1]]:
+            start = self._offsets[base + cell_id]
+            text = str(self._blob[start:start + self._lengths[base + cell_id]], 'utf-8')
+            cells.append((self.cells[cell_id].split(CELL_SEP), text))
+        return unflatten_paradigm(cells)
+
+    def close(self):
+        for view in (self._offsets, self._lengths, self._order_index, self._order, self._blob, self._view):
+            view.release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
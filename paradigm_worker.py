@@ -0,0 +1,178 @@
+"""Paradigm generation off the GUI thread.
+
+ParadigmWorker runs LatinDB.get_paradigm on a daemon thread. Requests are not
+queued: the worker holds a single slot that every new request overwrites, so
+when the user arrows through the list faster than paradigms are assembled, the
+selections in between are dropped and the newest one always wins. A request
+that is already running cannot be interrupted, but its result is discarded if
+a newer one has been made (it still lands in the paradigm cache).
+
+When no request is waiting, the worker prefetches: it warms the paradigm cache
+for the lemmas the GUI expects next (the rows around the selection, the top
+search hits). Prefetched paradigms nobody has asked for yet are "speculative".
+Their estimated size is kept under a memory budget, and they are dropped from
+the cache again once they are no longer prefetch targets, unless the GUI has
+asked for them in the meantime. A request always goes before the next
+prefetch; at worst it waits for one paradigm to finish.
+
+The worker never touches Tk. The GUI polls result() from an after() callback
+and renders on its own thread.
+
+A thread rather than a process: the database, its caches and the paradigms
+stay shared with the GUI, and the GIL's switch interval is short enough to keep
+the event loop responsive while a paradigm is being assembled.
+"""
+import sys
+import threading
+from collections import OrderedDict, deque
+
+DEFAULT_PREFETCH_BUDGET = 4 * 2**20  # bytes of speculative paradigms (~25-50 verbs)
+
+
+def estimate_size(obj):
+    """Approximate memory held by a paradigm: nested dicts, lists and strings, counted naively."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(key) + estimate_size(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(estimate_size(value) for value in obj)
+    return size
+
+
+class ParadigmWorker:
+
+    def __init__(self, db, prefetch_budget=DEFAULT_PREFETCH_BUDGET):
+        self.db = db
+        self.prefetch_budget = prefetch_budget
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._pending = None  # (generation, lemma) waiting to be computed
+        self._result = None   # (generation, lemma, paradigm, error) of the newest request
+        self._requested = None  # lemma of the newest request, or the one the GUI shows from the cache
+        self._computing = False
+        self._closed = False
+        self._targets = deque()        # lemmas still to prefetch, most wanted first
+        self._target_set = frozenset()
+        self._speculative = OrderedDict()  # lemma -> estimated size, prefetched but not yet requested
+        self._speculative_bytes = 0
+        self._average_size = 0
+        self._thread = threading.Thread(target=self._run, name="paradigm-worker", daemon=True)
+        self._thread.start()
+
+    def request(self, lemma):
+        """Asks for `lemma`'s paradigm, superseding every earlier request. Returns its generation."""
+        with self._condition:
+            self._generation += 1
+            self._pending = (self._generation, lemma)
+            self._result = None
+            self._requested = lemma
+            self._claim(lemma)
+            self._condition.notify()
+            return self._generation
+
+    def cancel(self):
+        """Drops the outstanding request, if any; a result already computing is discarded."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._result = None
+            self._requested = None
+
+    def claim(self, lemma):
+        """Cancels the outstanding request because the GUI is showing `lemma`, already cached."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._result = None
+            self._requested = lemma
+            self._claim(lemma)
+
+    def result(self):
+        """(lemma, paradigm, error) once the newest request is done, else None. Returned only once."""
+        with self._condition:
+            result, self._result = self._result, None
+        return None if result is None else result[1:]
+
+    @property
+    def busy(self):
+        with self._condition:
+            return self._pending is not None or self._computing
+
+    def prefetch(self, lemmas):
+        """
+        Replaces the prefetch targets, most wanted first. An empty list pauses prefetching
+        (the GUI does this while the user types). Speculative paradigms that are no longer
+        targets are dropped from the in-memory cache.
+        """
+        with self._condition:
+            self._targets = deque(lemmas)
+            self._target_set = frozenset(self._targets)
+            for lemma in [lemma for lemma in self._speculative if lemma not in self._target_set]:
+                self._forget(lemma)
+            self._condition.notify()
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._pending = None
+            self._targets.clear()
+            self._condition.notify()
+
+    # The underscored helpers below expect self._condition to be held.
+
+    def _claim(self, lemma):
+        size = self._speculative.pop(lemma, None)
+        if size is not None:
+            self._speculative_bytes -= size
+
+    def _forget(self, lemma):
+        self._claim(lemma)
+        self.db.forget_paradigm(lemma)
+
+    def _can_prefetch(self):
+        return bool(self._targets) and self._speculative_bytes + self._average_size <= self.prefetch_budget
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed and not self._can_prefetch():
+                    self._condition.wait()
+                if self._closed:
+                    return
+                if self._pending is not None:
+                    (generation, lemma), self._pending = self._pending, None
+                else:
+                    generation, lemma = None, self._targets.popleft()
+                self._computing = generation is not None
+            if generation is None:
+                self._prefetch_one(lemma)
+                continue
+            paradigm = error = None
+            try:
+                paradigm = self.db.get_paradigm(lemma)
+            except Exception as e:  # Reported to the GUI rather than killing the worker.
+                error = e
+            with self._condition:
+                self._computing = False
+                if generation == self._generation:
+                    self._result = (generation, lemma, paradigm, error)
+
+    def _prefetch_one(self, lemma):
+        # prefetch_paradigm, not get_paradigm: prefetches must not count as cache hits or misses.
+        try:
+            paradigm = self.db.prefetch_paradigm(lemma)
+        except Exception:
+            return  # A request for it will report the error.
+        if paradigm is None:
+            return  # Unknown, or already in memory and not ours to account for.
+        size = estimate_size(paradigm)
+        with self._condition:
+            if lemma == self._requested:
+                return  # Requested while it was being built: the GUI's now, not speculative.
+            if lemma in self._target_set and lemma not in self._speculative:
+                self._speculative[lemma] = size
+                self._speculative_bytes += size
+                self._average_size = self._speculative_bytes // len(self._speculative)
+            elif lemma not in self._target_set:
+                # The targets moved on while it was being built.
+                self.db.forget_paradigm(lemma)
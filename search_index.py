@@ -0,0 +1,105 @@
+"""Live lemma search for the GUI.
+
+LemmaSearchIndex is built once per lexicon. Lemmas keep the GUI's display order
+(plain sorted order) and are referred to by their position in it, so a result
+is a sorted sequence of ints. Three structures answer queries:
+
+* a sorted array of folded keys, searched with bisect, for prefix queries;
+* n-gram postings (every 1-, 2- and 3-gram of every key) for substring queries:
+  a query of up to three characters is a single posting list, a longer one the
+  intersection of its trigram postings, checked against the keys;
+* the results of the queries typed so far. A keystroke that extends the query
+  only filters the previous result, and a backspace returns a stored one.
+
+Keys are folded to lower case without macrons unless fold_macrons=False, so
+'amo' finds 'amō'.
+"""
+from bisect import bisect_left
+
+from latin_engine import demacronize
+
+GRAM_SIZES = (1, 2, 3)
+
+
+def fold_key(text, fold_macrons=True):
+    text = text.lower()
+    return demacronize(text) if fold_macrons else text
+
+
+class LemmaSearchIndex:
+
+    def __init__(self, lemmas, fold_macrons=True):
+        self.fold_macrons = fold_macrons
+        self.lemmas = sorted(lemmas)
+        self.keys = [fold_key(lemma, fold_macrons) for lemma in self.lemmas]
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys = [self.keys[i] for i in order]
+        self._sorted_ids = order
+        postings = {}
+        for lemma_id, key in enumerate(self.keys):
+            for size in GRAM_SIZES:
+                for start in range(len(key) - size + 1):
+                    ids = postings.setdefault(key[start:start + size], [])
+                    if not ids or ids[-1] != lemma_id:
+                        ids.append(lemma_id)
+        self._postings = {gram: tuple(ids) for gram, ids in postings.items()}
+        self._all = tuple(range(len(self.lemmas)))
+        # [(mode, folded query, result)] along the query being typed, each one narrowing the last.
+        self._history = []
+
+    def __len__(self):
+        return len(self.lemmas)
+
+    def prefix(self, query):
+        """Ids of the lemmas whose folded key starts with `query`, in display order."""
+        query = fold_key(query, self.fold_macrons)
+        start = bisect_left(self._sorted_keys, query)
+        end = bisect_left(self._sorted_keys, query + '\uffff', start)
+        return sorted(self._sorted_ids[start:end])
+
+    def _substring(self, query):
+        if len(query) <= GRAM_SIZES[-1]:
+            return self._postings.get(query, ())
+        size = GRAM_SIZES[-1]
+        grams = {query[i:i + size] for i in range(len(query) - size + 1)}
+        lists = sorted((self._postings.get(gram, ()) for gram in grams), key=len)
+        candidates = set(lists[0])
+        for ids in lists[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return ()
+        keys = self.keys
+        return sorted(i for i in candidates if query in keys[i])
+
+    def search(self, query, mode='substring'):
+        """
+        Ids of the lemmas matching `query` ('substring' or 'prefix'), in display order,
+        reusing the results of the previous queries whenever `query` narrows one of them.
+        """
+        folded = fold_key(query, self.fold_macrons)
+        if not folded:
+            self._history.clear()
+            return self._all
+        history = self._history
+        while history and not (history[-1][0] == mode and self._narrows(mode, history[-1][1], folded)):
+            history.pop()
+        if history and history[-1][1] == folded:
+            return history[-1][2]
+        if history:
+            keys = self.keys
+            previous = history[-1][2]
+            if mode == 'prefix':
+                result = [i for i in previous if keys[i].startswith(folded)]
+            else:
+                result = [i for i in previous if folded in keys[i]]
+        elif mode == 'prefix':
+            result = self.prefix(folded)
+        else:
+            result = self._substring(folded)
+        history.append((mode, folded, result))
+        return result
+
+    @staticmethod
+    def _narrows(mode, previous, query):
+        """True if every match of `query` is also a match of `previous`."""
+        return query.startswith(previous) if mode == 'prefix' else previous in query
@@ -0,0 +1,83 @@
+"""Long-lived NDJSON conjugation service over a pair of text streams.
+
+Each input line is either a bare lemma (``agō``, or ``ago`` without macrons)
+or a JSON query object::
+
+    {"lemma": "ago", "id": 7, "cells": ["INDICATIVE ACTIVE|Perfect|0"]}
+
+and produces exactly one JSON line on the output, flushed immediately::
+
+    {"id": 7, "lemma": "agō", "cells": {"INDICATIVE ACTIVE|Perfect|0": "ēgī"}}
+
+``cells`` restricts the answer to the listed cell paths (see paradigm_store);
+without it the whole assembled paradigm is returned. Failures produce an
+``{"error": ...}`` line instead, so the output stays aligned with the input.
+"""
+import json
+
+from latin_engine import demacronize
+from paradigm_store import flatten_paradigm, CELL_SEP
+
+
+def resolve_lemmas(db, query):
+    """The lemma itself if it exists, otherwise every lemma spelled the same without macrons."""
+    if query in db.verbs:
+        return (query,)
+    return db.demacronized_index.lemmas(demacronize(query))
+
+
+def parse_query(line):
+    line = line.strip()
+    if line.startswith('{'):
+        query = json.loads(line)
+        if not isinstance(query.get('lemma'), str):
+            raise ValueError("query object needs a string 'lemma'")
+        return query
+    return {'lemma': line}
+
+
+def answer(db, query, store=None):
+    response = {'id': query['id']} if 'id' in query else {}
+    lemmas = resolve_lemmas(db, query['lemma'])
+    if not lemmas:
+        response['error'] = f"unknown lemma: {query['lemma']}"
+        return response
+    if len(lemmas) > 1:
+        response['error'] = f"ambiguous lemma: {query['lemma']}"
+        response['candidates'] = list(lemmas)
+        return response
+    lemma = lemmas[0]
+    response['lemma'] = lemma
+    cells = query.get('cells')
+    if store is not None and lemma in store:
+        if cells is None:
+            response['paradigm'] = store.paradigm(lemma)
+        else:
+            response['cells'] = {cell: store.cell_text(lemma, cell) for cell in cells}
+        return response
+
+    paradigm = db.get_paradigm(lemma)
+    if cells is None:
+        response['paradigm'] = paradigm
+    else:
+        flat = {CELL_SEP.join(path): text for path, text in flatten_paradigm(paradigm)}
+        response['cells'] = {cell: flat.get(cell) for cell in cells}
+    return response
+
+
+def serve(db, stdin, stdout, store=None):
+    """Answers queries from `stdin` one line at a time until EOF. Returns the number served."""
+    served = 0
+    # readline() rather than iterating the stream, so each record is answered as soon as it
+    # arrives instead of after a read-ahead buffer fills.
+    for line in iter(stdin.readline, ''):
+        if not line.strip():
+            continue
+        try:
+            response = answer(db, parse_query(line), store)
+        except Exception as e:
+            response = {'error': f"{type(e).__name__}: {e}", 'input': line.rstrip('\n')}
+        stdout.write(json.dumps(response, ensure_ascii=False) + '\n')
+        stdout.flush()
+        served += 1
+    return served
@@ -0,0 +1,126 @@
+"""Inverted tag index: tag -> set of verbs, as a bitset.
+
+Verbs are numbered in sorted lemma order (the GUI's display order) and a set of
+verbs is a plain Python int with bit i set for verb i, so filters are integer
+AND / OR / AND NOT and counts are popcounts. The index is built once from the
+raw lexicon properties; no Verb is constructed.
+
+Besides exact tags, a query term can name a parametrised family or a pattern:
+
+    'deponent'                           exact tag
+    'compound'                           every 'compound(...)' tag
+    'compound(ab+*)', 'compound(ab+…)'   shell-style pattern ('…' stands for '*')
+"""
+from fnmatch import fnmatchcase
+
+
+class TagIndex:
+
+    def __init__(self, verb_properties):
+        self.lemmas = sorted(verb_properties)
+        self.lemma_ids = {lemma: i for i, lemma in enumerate(self.lemmas)}
+        self.all = (1 << len(self.lemmas)) - 1
+        members = {}
+        for lemma_id, lemma in enumerate(self.lemmas):
+            for tags in verb_properties[lemma].values():
+                for tag in tags:
+                    members.setdefault(tag, []).append(lemma_id)
+        self._bits = {}
+        for tag, lemma_ids in members.items():
+            bits = 0
+            for lemma_id in lemma_ids:
+                bits |= 1 << lemma_id
+            self._bits[tag] = bits
+        self._families = {}
+        for tag in self._bits:
+            family, paren, _ = tag.partition('(')
+            if paren:
+                self._families.setdefault(family, []).append(tag)
+        self._expanded = {}
+
+    def state(self):
+        """The index as plain data (lemmas, {tag: bits}), for lexicon snapshots."""
+        return self.lemmas, self._bits
+
+    @classmethod
+    def from_state(cls, state):
+        index = cls({})
+        index.lemmas, index._bits = state
+        index.lemma_ids = {lemma: i for i, lemma in enumerate(index.lemmas)}
+        index.all = (1 << len(index.lemmas)) - 1
+        for tag in index._bits:
+            family, paren, _ = tag.partition('(')
+            if paren:
+                index._families.setdefault(family, []).append(tag)
+        return index
+
+    def tags(self):
+        """Every tag in the lexicon, sorted."""
+        return sorted(self._bits)
+
+    def families(self):
+        """{family: its tags} for the parametrised tags, e.g. 'compound' -> ['compound(ab+agō)', ...]."""
+        return {family: sorted(tags) for family, tags in self._families.items()}
+
+    def expand(self, term):
+        """The tags a query term stands for (see the module docstring)."""
+        tags = self._expanded.get(term)
+        if tags is None:
+            if term in self._bits:
+                tags = (term,)
+            elif term in self._families:
+                tags = tuple(self._families[term])
+            else:
+                pattern = term.replace('…', '*')
+                if any(char in pattern for char in '*?['):
+                    tags = tuple(tag for tag in self._bits if fnmatchcase(tag, pattern))
+                else:
+                    tags = ()
+            self._expanded[term] = tags
+        return tags
+
+    def bits(self, term):
+        """Bitset of the verbs carrying `term` (0 if no verb does)."""
+        tags = self.expand(term)
+        if len(tags) == 1:
+            return self._bits[tags[0]]
+        bits = 0
+        for tag in tags:
+            bits |= self._bits[tag]
+        return bits
+
+    def select(self, all_of=(), any_of=(), none_of=()):
+        """Bitset of the verbs carrying every term of `all_of`, one of `any_of` (if given) and none of `none_of`."""
+        bits = self.all
+        for term in all_of:
+            bits &= self.bits(term)
+        if any_of:
+            either = 0
+            for term in any_of:
+                either |= self.bits(term)
+            bits &= either
+        for term in none_of:
+            bits &= ~self.bits(term)
+        return bits
+
+    def count(self, term_or_bits):
+        bits = self.bits(term_or_bits) if isinstance(term_or_bits, str) else term_or_bits
+        return bits.bit_count()
+
+    def counts(self):
+        """{tag: number of verbs} for every tag."""
+        return {tag: bits.bit_count() for tag, bits in self._bits.items()}
+
+    def has(self, bits, lemma):
+        lemma_id = self.lemma_ids.get(lemma)
+        return lemma_id is not None and bits >> lemma_id & 1 == 1
+
+    def ids(self, bits):
+        """Verb ids in a bitset, ascending."""
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def select_lemmas(self, bits):
+        return [self.lemmas[i] for i in self.ids(bits)]